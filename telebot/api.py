@@ -1,13 +1,28 @@
+import asyncio
+import functools
 import logging
 import os
+import random
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union, cast
 
 import aiohttp
-import ujson as json  # type: ignore
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import ujson  # type: ignore
+
+    _dumps = ujson.dumps
+    _loads = ujson.loads
 
 from telebot import types, util
 
@@ -19,37 +34,93 @@ CUSTOM_SERIALIZER = None
 
 DEFAULT_REQUEST_TIMEOUT = None
 MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 15.0
+# longest we honor Telegram's retry_after hint; flood waits can be thousands of seconds
+# and sleeping through them would block the caller far longer than just failing
+RETRY_AFTER_MAX_DELAY = 60.0
 REQUEST_LIMIT = 50
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+_NO_TIMEOUT = aiohttp.ClientTimeout(total=None)
+
+# transient network-level errors worth retrying; programming errors and non-retryable
+# API responses propagate to the caller immediately
+_RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectorError,
+    aiohttp.ServerDisconnectedError,
+    aiohttp.ClientOSError,
+    asyncio.TimeoutError,
+)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter, capped at RETRY_MAX_DELAY."""
+    return random.random() * min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY)
 
 
 class SessionManager:
     def __init__(self) -> None:
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def set_session(self, session: aiohttp.ClientSession):
         self.session = session
+        self._session_loop = asyncio.get_event_loop()
 
     async def close_session(self):
         if self.session is not None:
             await self.session.close()
+            self.session = None
+            self._session_loop = None
 
     async def init_session(self):
-        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=REQUEST_LIMIT))
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=REQUEST_LIMIT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                force_close=False,
+            ),
+            json_serialize=_dumps,
+        )
+        self._session_loop = asyncio.get_running_loop()
 
     async def get_session(self) -> aiohttp.ClientSession:
-        if self.session is None or self.session.closed or not self.session._loop.is_running():
+        if self.session is None or self.session.closed or self._session_loop is not asyncio.get_running_loop():
             await self.init_session()
         return cast(aiohttp.ClientSession, self.session)
 
 
 session_manager = SessionManager()
 
+# hot-path alias, avoids re-resolving the module attribute on every media send
+_is_string = util.is_string
+
 
 FileObject = Union[BytesIO, bytes, bytearray, memoryview]
 Params = dict[str, Any]
 Files = dict[str, Union[tuple[str, FileObject], FileObject]]
 
 
+@functools.lru_cache(maxsize=32)
+def _redaction_re(secret: str) -> "re.Pattern[str]":
+    """Compiled pattern matching a secret to be redacted from logs; compiled once per
+    token and easy to extend to several secret patterns via alternation."""
+    return re.compile(re.escape(secret))
+
+
+@functools.lru_cache(maxsize=32)
+def _base_url(token: str) -> str:
+    return f"https://api.telegram.org/bot{token}/"
+
+
+@functools.lru_cache(maxsize=32)
+def _file_base_url(token: str) -> str:
+    return f"https://api.telegram.org/file/bot{token}/"
+
+
 def _format_fileobject(fo: FileObject) -> str:
     if not isinstance(fo, BytesIO):
         return f"{type(fo)}({fo[:16]!r})"
@@ -57,6 +128,45 @@ def _format_fileobject(fo: FileObject) -> str:
         return "(bytes IO)"
 
 
+class _RequestDescription:
+    """Lazily formatted request description for logging; building reprs of potentially
+    large params/files is deferred until a log record is actually emitted."""
+
+    __slots__ = ("token", "method", "route", "params", "files", "request_timeout")
+
+    def __init__(
+        self,
+        token: str,
+        method: str,
+        route: str,
+        params: Optional[Params],
+        files: Optional[Files],
+        request_timeout: Optional[float],
+    ) -> None:
+        self.token = token
+        self.method = method
+        self.route = route
+        self.params = params
+        self.files = files
+        self.request_timeout = request_timeout
+
+    def __str__(self) -> str:
+        method = self.method
+        route = self.route
+        params = self.params
+        request_timeout = self.request_timeout
+        files_to_log = (
+            {
+                k: (v[0], _format_fileobject(v[1])) if isinstance(v, tuple) else _format_fileobject(v)
+                for k, v in self.files.items()
+            }
+            if self.files is not None
+            else {}
+        )
+        description = f"{method = } {route = } {params = } files = {files_to_log} {request_timeout = }"
+        return _redaction_re(self.token).sub("<bot-token>", description)
+
+
 async def _request(
     token: str,
     route: str,
@@ -66,45 +176,89 @@ async def _request(
     request_timeout: Optional[float] = None,
 ):
     session = await session_manager.get_session()
-    if logger.isEnabledFor(logging.DEBUG):
-        files_to_log = (
-            {
-                k: (v[0], _format_fileobject(v[1])) if isinstance(v, tuple) else _format_fileobject(v)
-                for k, v in files.items()
-            }
-            if files is not None
-            else {}
-        )
-        request_description = f"{method = } {route = } {params = } files = {files_to_log} {request_timeout = }"
-        request_description = request_description.replace(token, "<bot-token>")
-        logger.debug("Making request: %s", request_description)
+    request_description = _RequestDescription(token, method, route, params, files, request_timeout)
+    logger.debug("Making request: %s", request_description)
     last_exception: Optional[Exception] = None
     for attempt in range(MAX_RETRIES):
         try:
             async with session.request(
                 method=method,
-                url="https://api.telegram.org/bot{0}/{1}".format(token, route),
-                data=to_form_data(params, files),
-                timeout=aiohttp.ClientTimeout(total=request_timeout or DEFAULT_REQUEST_TIMEOUT),
+                url=_base_url(token) + route,
+                data=_request_data(params, files),
+                timeout=(
+                    aiohttp.ClientTimeout(total=request_timeout or DEFAULT_REQUEST_TIMEOUT)
+                    if request_timeout or DEFAULT_REQUEST_TIMEOUT
+                    else _NO_TIMEOUT
+                ),
             ) as resp:
                 json_result = await _check_response(resp)
                 if json_result:
                     return json_result["result"]
+        except asyncio.CancelledError:
+            raise
+        except ApiHTTPException as e:
+            status = e.response.status
+            if status != 429 and status < 500:
+                raise
+            last_exception = e
+            if attempt + 1 == MAX_RETRIES:
+                break  # no attempts left, no point sleeping before the re-raise
+            retry_after = e.error_parameters.retry_after if e.error_parameters is not None else None
+            delay = min(retry_after, RETRY_AFTER_MAX_DELAY) if retry_after is not None else _backoff_delay(attempt)
+            logger.info(
+                "Retrying (%s / %s) after error response (HTTP %s), sleeping for %.2f sec",
+                attempt + 1,
+                MAX_RETRIES,
+                status,
+                delay,
+            )
+            await asyncio.sleep(delay)
         except ApiException:
             raise
-        except Exception as e:
+        except _RETRYABLE_ERRORS as e:
             last_exception = e
+            if attempt + 1 == MAX_RETRIES:
+                break
             logger.info(
-                "Retrying (%s / %s) unexpected error making request (%s)",
+                "Retrying (%s / %s) transient error making request (%s)",
                 attempt + 1,
                 MAX_RETRIES,
                 request_description,
                 exc_info=True,
             )
-    else:
-        if last_exception is not None:
-            logger.error("Request (%s) didn't succeeded, reraising last exception", request_description)
-            raise last_exception
+            await asyncio.sleep(_backoff_delay(attempt))
+    if last_exception is not None:
+        logger.error("Request (%s) didn't succeeded, reraising last exception", request_description)
+        raise last_exception
+
+
+async def send_many(
+    token: str,
+    calls: List[Tuple[str, Optional[Params], Optional[Files]]],
+    concurrency: int = REQUEST_LIMIT,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Issue several prepared API calls concurrently, overlapping their network round-trips.
+
+    Each call is a (route, params, files) tuple as accepted by _request. Concurrency is
+    bounded by a semaphore (the connector limit by default): larger batches improve
+    throughput on fan-out workloads at the cost of per-call latency. Results are returned
+    in the order of the input calls. With return_exceptions, a failed call yields its
+    exception in the result list instead of aborting the whole batch — the usual choice
+    for broadcasts where one blocked chat should not stop delivery to the rest.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded_request(route: str, params: Optional[Params], files: Optional[Files]) -> Any:
+        async with semaphore:
+            return await _request(token, route, method="post" if files else "get", params=params, files=files)
+
+    return list(
+        await asyncio.gather(
+            *(bounded_request(*call) for call in calls),
+            return_exceptions=return_exceptions,
+        )
+    )
 
 
 def extract_filename(obj: Any) -> Optional[str]:
@@ -115,12 +269,50 @@ def extract_filename(obj: Any) -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=1024)
+def _ts(dt: datetime) -> float:
+    """Cached datetime -> POSIX timestamp; kick/mute waves apply one precomputed expiry
+    to many users, and datetime.timestamp() is not cheap."""
+    return dt.timestamp()
+
+
+@functools.lru_cache(maxsize=4096)
+def _int_str(value: int) -> str:
+    """Cached str form of int params; chat ids repeat heavily in broadcast-style workloads."""
+    return str(value)
+
+
+def _serialize_value(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    elif value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif isinstance(value, int):
+        return _int_str(value)
+    else:
+        return str(value)
+
+
+def _request_data(params: Optional[Params], files: Optional[Files]) -> Union[aiohttp.FormData, Params, None]:
+    """Multipart form data is only needed when uploading files; for the common file-less
+    case a plain dict is cheaper and is urlencoded by aiohttp."""
+    if files:
+        return to_form_data(params, files)
+    elif params:
+        return {key: _serialize_value(value) for key, value in params.items()}
+    else:
+        return None
+
+
 def to_form_data(params: Optional[Params] = None, files: Optional[Files] = None) -> aiohttp.FormData:
     data = aiohttp.formdata.FormData(quote_fields=False)
+    add_field = data.add_field
 
     if params:
         for key, value in params.items():
-            data.add_field(key, str(value))
+            add_field(key, _serialize_value(value))
 
     if files:
         for key, f in files.items():
@@ -132,12 +324,68 @@ def to_form_data(params: Optional[Params] = None, files: Optional[Files] = None)
             else:
                 filename, file_object = extract_filename(f) or key, f
 
-            data.add_field(key, file_object, filename=filename)
+            add_field(key, file_object, filename=filename)
 
     return data
 
 
-async def _convert_markup(markup):
+def _entities_json(entities: Union[List["types.MessageEntity"], str]) -> str:
+    """Serialize a message entity list, caching the JSON for recently seen lists; broadcast
+    bots resend the same formatted text many times and can skip re-serialization. A str is
+    treated as already-serialized JSON and passed through unchanged."""
+    if isinstance(entities, str):
+        return entities
+    try:
+        return _entities_json_cached(tuple(entities))
+    except TypeError:  # entities with unhashable field values
+        return _dumps(types.MessageEntity.to_list_of_dicts(entities))
+
+
+@functools.lru_cache(maxsize=1024)
+def _entities_json_cached(entities: tuple) -> str:
+    return _dumps(types.MessageEntity.to_list_of_dicts(entities))
+
+
+def _single_flight(func):
+    """Coalesce concurrent identical calls: while one is in flight, callers with the same
+    arguments await its result instead of issuing duplicate HTTP requests. Meant for the
+    read-only bot-metadata getters, which many handlers tend to hit at startup."""
+    inflight: Dict[tuple, "asyncio.Task[Any]"] = {}
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        existing = inflight.get(key)
+        if existing is not None:
+            return await existing
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        inflight[key] = task
+        try:
+            return await task
+        finally:
+            inflight.pop(key, None)
+
+    return wrapper
+
+
+def _attach_thumb(files: Optional[Files], payload: Params, thumb) -> Optional[Files]:
+    """Route a thumbnail either into the payload (file id / URL) or the files dict,
+    creating the latter if needed; shared by the five senders that accept thumbs."""
+    if not thumb:
+        return files
+    if _is_string(thumb):
+        payload["thumb"] = thumb
+        return files
+    if files is None:
+        return {"thumb": thumb}
+    files["thumb"] = thumb
+    return files
+
+
+def _convert_markup(markup):
+    """Serialize a markup object to JSON; anything else (notably an already-serialized
+    str) passes through unchanged, so fan-out callers sending one keyboard to many chats
+    can call to_json() once and pass the string."""
     if isinstance(markup, types.JsonSerializable):
         return markup.to_json()
     return markup
@@ -161,14 +409,16 @@ async def get_file(token, file_id):
 
 async def get_file_url(token: str, file_id: str):
     if FILE_URL is None:
-        return "https://api.telegram.org/file/bot{0}/{1}".format(token, (await get_file(token, file_id))["file_path"])
+        return _file_base_url(token) + (await get_file(token, file_id))["file_path"]
     else:
         return FILE_URL.format(token, (await get_file(token, file_id))["file_path"])
 
 
-async def download_file(token: str, file_path: str):
+async def download_file_to(token: str, file_path: str, destination: BinaryIO, chunk_size: int = 64 * 1024) -> None:
+    """Stream a file from Telegram servers into a writable binary stream; memory usage is
+    bounded by chunk_size instead of the full file (up to 2 Gb with a local API server)."""
     if FILE_URL is None:
-        url = "https://api.telegram.org/file/bot{0}/{1}".format(token, file_path)
+        url = _file_base_url(token) + file_path
     else:
         url = FILE_URL.format(token, file_path)
     session = await session_manager.get_session()
@@ -179,7 +429,14 @@ async def download_file(token: str, file_path: str):
             except Exception:
                 response_json = None
             raise ApiHTTPException(response_json, response)
-        return await response.read()
+        async for chunk in response.content.iter_chunked(chunk_size):
+            destination.write(chunk)
+
+
+async def download_file(token: str, file_path: str) -> bytes:
+    destination = BytesIO()
+    await download_file_to(token, file_path, destination)
+    return destination.getvalue()
 
 
 async def set_webhook(
@@ -198,7 +455,7 @@ async def set_webhook(
     if max_connections:
         params["max_connections"] = max_connections
     if allowed_updates is not None:  # Empty lists should pass
-        params["allowed_updates"] = json.dumps(allowed_updates)
+        params["allowed_updates"] = _dumps(allowed_updates)
     if ip_address is not None:  # Empty string should pass
         params["ip_address"] = ip_address
     if drop_pending_updates is not None:  # Any bool value should pass
@@ -209,21 +466,19 @@ async def set_webhook(
 
 
 async def delete_webhook(token, drop_pending_updates=None, timeout=None):
-    method_url = r"deleteWebhook"
     payload = {}
     if drop_pending_updates is not None:  # Any bool value should pass
         payload["drop_pending_updates"] = drop_pending_updates
     if timeout:
         payload["timeout"] = timeout
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "deleteWebhook", params=payload)
 
 
 async def get_webhook_info(token, timeout=None):
-    method_url = r"getWebhookInfo"
     payload = {}
     if timeout:
         payload["timeout"] = timeout
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getWebhookInfo", params=payload)
 
 
 async def get_updates(
@@ -242,7 +497,7 @@ async def get_updates(
     if timeout:
         params["timeout"] = timeout
     if allowed_updates:
-        params["allowed_updates"] = json.dumps(allowed_updates)
+        params["allowed_updates"] = _dumps(allowed_updates)
     return await _request(token, route="getUpdates", params=params, request_timeout=request_timeout)
 
 
@@ -259,9 +514,8 @@ async def _check_response(response: aiohttp.ClientResponse):
     :param result: The returned result of the method request
     :return: The result parsed to a JSON dictionary.
     """
-    await response.text()  # loading response body
     try:
-        result_json = await response.json(encoding="utf-8")
+        result_json = _loads(await response.read())
     except Exception as e:
         raise ApiInvalidJSONException(response, e)
     if not isinstance(result_json, dict) or result_json.get("ok") is not True:
@@ -269,9 +523,11 @@ async def _check_response(response: aiohttp.ClientResponse):
     return result_json
 
 
-def _add_message_thread_id(params: Dict[str, Any], message_thread_id: Optional[int]) -> None:
-    if message_thread_id is not None:
-        params["message_thread_id"] = message_thread_id
+def _build_params(*pairs: tuple) -> Params:
+    """Build a params dict from (key, value, if_truthy) triples in one pass, replacing
+    the per-field `if value: payload[key] = value` ladders; if_truthy selects between
+    the truthiness check and the laxer `is not None` one."""
+    return {key: value for key, value, if_truthy in pairs if (bool(value) if if_truthy else value is not None)}
 
 
 async def send_message(
@@ -305,69 +561,57 @@ async def send_message(
     :param protect_content:
     :return:
     """
-    method_name = "sendMessage"
-    params: Dict[str, Any] = {"chat_id": str(chat_id), "text": text}
-    if disable_web_page_preview is not None:
-        params["disable_web_page_preview"] = disable_web_page_preview
-    if reply_to_message_id:
-        params["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        params["reply_markup"] = await _convert_markup(reply_markup)
-    if parse_mode:
-        params["parse_mode"] = parse_mode
-    if disable_notification is not None:
-        params["disable_notification"] = disable_notification
-    if timeout:
-        params["timeout"] = timeout
-    if entities:
-        params["entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(entities))
-    if allow_sending_without_reply is not None:
-        params["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        params["protect_content"] = protect_content
-    _add_message_thread_id(params, message_thread_id)
-    return await _request(token, method_name, params=params)
+    params: Dict[str, Any] = {"chat_id": chat_id, "text": text}
+    params.update(
+        _build_params(
+            ("disable_web_page_preview", disable_web_page_preview, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("parse_mode", parse_mode, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("entities", _entities_json(entities) if entities else None, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendMessage", params=params)
 
 
 # methods
 
 
 async def get_user_profile_photos(token, user_id, offset=None, limit=None):
-    method_url = r"getUserProfilePhotos"
     payload = {"user_id": user_id}
     if offset:
         payload["offset"] = offset
     if limit:
         payload["limit"] = limit
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getUserProfilePhotos", params=payload)
 
 
 async def get_chat(token, chat_id):
-    method_url = r"getChat"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getChat", params=payload)
 
 
 async def leave_chat(token, chat_id):
-    method_url = r"leaveChat"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "leaveChat", params=payload)
 
 
 async def get_chat_administrators(token, chat_id):
-    method_url = r"getChatAdministrators"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getChatAdministrators", params=payload)
 
 
 async def get_chat_member_count(token, chat_id):
-    method_url = r"getChatMemberCount"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getChatMemberCount", params=payload)
 
 
 async def set_sticker_set_thumb(token, name, user_id, thumb):
-    method_url = r"setStickerSetThumb"
     payload = {"name": name, "user_id": user_id}
     files = {}
     if thumb:
@@ -375,31 +619,27 @@ async def set_sticker_set_thumb(token, name, user_id, thumb):
             files["thumb"] = thumb
         else:
             payload["thumb"] = thumb
-    return await _request(token, method_url, params=payload, files=files or None)
+    return await _request(token, "setStickerSetThumb", params=payload, files=files or None)
 
 
 async def set_chat_sticker_set(token, chat_id, sticker_set_name):
-    method_url = r"setChatStickerSet"
     payload = {"chat_id": chat_id, "sticker_set_name": sticker_set_name}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "setChatStickerSet", params=payload)
 
 
 async def delete_chat_sticker_set(token, chat_id):
-    method_url = r"deleteChatStickerSet"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "deleteChatStickerSet", params=payload)
 
 
 async def answer_web_app_query(token, web_app_query_id, result: types.InlineQueryResultBase):
-    method_url = "answerWebAppQuery"
     payload = {"web_app_query_id": web_app_query_id, "result": result.to_json()}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "answerWebAppQuery", params=payload, method="post")
 
 
 async def get_chat_member(token, chat_id, user_id):
-    method_url = r"getChatMember"
     payload = {"chat_id": chat_id, "user_id": user_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getChatMember", params=payload)
 
 
 async def forward_message(
@@ -412,20 +652,20 @@ async def forward_message(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"forwardMessage"
     payload = {
         "chat_id": chat_id,
         "from_chat_id": from_chat_id,
         "message_id": message_id,
     }
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "forwardMessage", params=payload)
 
 
 async def copy_message(
@@ -444,32 +684,26 @@ async def copy_message(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"copyMessage"
     payload = {
         "chat_id": chat_id,
         "from_chat_id": from_chat_id,
         "message_id": message_id,
     }
-    if caption is not None:
-        payload["caption"] = caption
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if caption_entities is not None:
-        payload["caption_entities"] = await _convert_entites(caption_entities)
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup is not None:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if timeout:
-        payload["timeout"] = timeout
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("caption", caption, False),
+            ("parse_mode", parse_mode, True),
+            ("caption_entities", _convert_entites(caption_entities) if caption_entities is not None else None, False),
+            ("disable_notification", disable_notification, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup is not None else None, False),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("timeout", timeout, True),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "copyMessage", params=payload)
 
 
 async def send_dice(
@@ -484,24 +718,20 @@ async def send_dice(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendDice"
     payload = {"chat_id": chat_id}
-    if emoji:
-        payload["emoji"] = emoji
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if timeout:
-        payload["timeout"] = timeout
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("emoji", emoji, True),
+            ("disable_notification", disable_notification, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("timeout", timeout, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendDice", params=payload)
 
 
 async def send_photo(
@@ -520,35 +750,32 @@ async def send_photo(
     message_thread_id: Optional[int] = None,
     has_spoiler: Optional[bool] = None,
 ):
-    method_url = r"sendPhoto"
     payload = {"chat_id": chat_id}
     files = None
-    if util.is_string(photo):
+    if _is_string(photo):
         payload["photo"] = photo
     else:
         files = {"photo": photo}
-    if caption:
-        payload["caption"] = caption
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if caption_entities:
-        payload["caption_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(caption_entities))
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    if has_spoiler is not None:
-        payload["has_spoiler"] = has_spoiler
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    payload.update(
+        _build_params(
+            ("caption", caption, True),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("parse_mode", parse_mode, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            (
+                "caption_entities",
+                _entities_json(caption_entities) if caption_entities else None,
+                True,
+            ),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("has_spoiler", has_spoiler, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendPhoto", params=payload, files=files, method="post")
 
 
 async def send_media_group(
@@ -562,23 +789,21 @@ async def send_media_group(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendMediaGroup"
-    media_json, files = await convert_input_media_array(media)
+    media_json, files = convert_input_media_array(media)
     payload = {"chat_id": chat_id, "media": media_json}
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if timeout:
-        payload["timeout"] = timeout
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
+    payload.update(
+        _build_params(
+            ("disable_notification", disable_notification, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("timeout", timeout, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
     return await _request(
         token,
-        method_url,
+        "sendMediaGroup",
         params=payload,
         method="post" if files else "get",
         files=files if files else None,
@@ -602,30 +827,23 @@ async def send_location(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendLocation"
     payload = {"chat_id": chat_id, "latitude": latitude, "longitude": longitude}
-    if live_period:
-        payload["live_period"] = live_period
-    if horizontal_accuracy:
-        payload["horizontal_accuracy"] = horizontal_accuracy
-    if heading:
-        payload["heading"] = heading
-    if proximity_alert_radius:
-        payload["proximity_alert_radius"] = proximity_alert_radius
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("live_period", live_period, True),
+            ("horizontal_accuracy", horizontal_accuracy, True),
+            ("heading", heading, True),
+            ("proximity_alert_radius", proximity_alert_radius, True),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendLocation", params=payload)
 
 
 async def edit_message_live_location(
@@ -641,25 +859,20 @@ async def edit_message_live_location(
     heading=None,
     proximity_alert_radius=None,
 ):
-    method_url = r"editMessageLiveLocation"
     payload = {"latitude": latitude, "longitude": longitude}
-    if chat_id:
-        payload["chat_id"] = chat_id
-    if message_id:
-        payload["message_id"] = message_id
-    if horizontal_accuracy:
-        payload["horizontal_accuracy"] = horizontal_accuracy
-    if heading:
-        payload["heading"] = heading
-    if proximity_alert_radius:
-        payload["proximity_alert_radius"] = proximity_alert_radius
-    if inline_message_id:
-        payload["inline_message_id"] = inline_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if timeout:
-        payload["timeout"] = timeout
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("chat_id", chat_id, True),
+            ("message_id", message_id, True),
+            ("horizontal_accuracy", horizontal_accuracy, True),
+            ("heading", heading, True),
+            ("proximity_alert_radius", proximity_alert_radius, True),
+            ("inline_message_id", inline_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("timeout", timeout, True),
+        )
+    )
+    return await _request(token, "editMessageLiveLocation", params=payload)
 
 
 async def stop_message_live_location(
@@ -670,19 +883,14 @@ async def stop_message_live_location(
     reply_markup=None,
     timeout=None,
 ):
-    method_url = r"stopMessageLiveLocation"
-    payload = {}
-    if chat_id:
-        payload["chat_id"] = chat_id
-    if message_id:
-        payload["message_id"] = message_id
-    if inline_message_id:
-        payload["inline_message_id"] = inline_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if timeout:
-        payload["timeout"] = timeout
-    return await _request(token, method_url, params=payload)
+    payload = _build_params(
+        ("chat_id", chat_id, True),
+        ("message_id", message_id, True),
+        ("inline_message_id", inline_message_id, True),
+        ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+        ("timeout", timeout, True),
+    )
+    return await _request(token, "stopMessageLiveLocation", params=payload)
 
 
 async def send_venue(
@@ -704,7 +912,6 @@ async def send_venue(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendVenue"
     payload = {
         "chat_id": chat_id,
         "latitude": latitude,
@@ -712,28 +919,22 @@ async def send_venue(
         "title": title,
         "address": address,
     }
-    if foursquare_id:
-        payload["foursquare_id"] = foursquare_id
-    if foursquare_type:
-        payload["foursquare_type"] = foursquare_type
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if timeout:
-        payload["timeout"] = timeout
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if google_place_id:
-        payload["google_place_id"] = google_place_id
-    if google_place_type:
-        payload["google_place_type"] = google_place_type
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("foursquare_id", foursquare_id, True),
+            ("foursquare_type", foursquare_type, True),
+            ("disable_notification", disable_notification, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("timeout", timeout, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("google_place_id", google_place_id, True),
+            ("google_place_type", google_place_type, True),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendVenue", params=payload)
 
 
 async def send_contact(
@@ -751,39 +952,34 @@ async def send_contact(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendContact"
     payload = {
         "chat_id": chat_id,
         "phone_number": phone_number,
         "first_name": first_name,
     }
-    if last_name:
-        payload["last_name"] = last_name
-    if vcard:
-        payload["vcard"] = vcard
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if timeout:
-        payload["timeout"] = timeout
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("last_name", last_name, True),
+            ("vcard", vcard, True),
+            ("disable_notification", disable_notification, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("timeout", timeout, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendContact", params=payload)
 
 
 async def send_chat_action(token, chat_id, action, timeout=None, message_thread_id: Optional[int] = None):
-    route = r"sendChatAction"
     payload = {"chat_id": chat_id, "action": action}
     if timeout:
         payload["timeout"] = timeout
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, route, params=payload)
+    if message_thread_id is not None:
+        payload["message_thread_id"] = message_thread_id
+    return await _request(token, "sendChatAction", params=payload)
 
 
 async def send_video(
@@ -807,51 +1003,37 @@ async def send_video(
     message_thread_id: Optional[int] = None,
     has_spoiler: Optional[bool] = None,
 ):
-    method_url = r"sendVideo"
     payload = {"chat_id": chat_id}
     files = None
-    if not util.is_string(data):
+    if not _is_string(data):
         files = {"video": data}
     else:
         payload["video"] = data
-    if duration:
-        payload["duration"] = duration
-    if caption:
-        payload["caption"] = caption
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if supports_streaming is not None:
-        payload["supports_streaming"] = supports_streaming
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if thumb:
-        if not util.is_string(thumb):
-            if files:
-                files["thumb"] = thumb
-            else:
-                files = {"thumb": thumb}
-        else:
-            payload["thumb"] = thumb
-    if width:
-        payload["width"] = width
-    if height:
-        payload["height"] = height
-    if caption_entities:
-        payload["caption_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(caption_entities))
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    if has_spoiler is not None:
-        payload["has_spoiler"] = has_spoiler
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    files = _attach_thumb(files, payload, thumb)
+    payload.update(
+        _build_params(
+            ("duration", duration, True),
+            ("caption", caption, True),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("parse_mode", parse_mode, True),
+            ("supports_streaming", supports_streaming, False),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("width", width, True),
+            ("height", height, True),
+            (
+                "caption_entities",
+                _entities_json(caption_entities) if caption_entities else None,
+                True,
+            ),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("has_spoiler", has_spoiler, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendVideo", params=payload, files=files, method="post")
 
 
 async def send_animation(
@@ -874,50 +1056,36 @@ async def send_animation(
     message_thread_id: Optional[int] = None,
     has_spoiler: Optional[bool] = None,
 ):
-    method_url = r"sendAnimation"
     payload = {"chat_id": chat_id}
     files = None
-    if not util.is_string(data):
+    if not _is_string(data):
         files = {"animation": data}
     else:
         payload["animation"] = data
-    if duration:
-        payload["duration"] = duration
-    if caption:
-        payload["caption"] = caption
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if thumb:
-        if not util.is_string(thumb):
-            if files:
-                files["thumb"] = thumb
-            else:
-                files = {"thumb": thumb}
-        else:
-            payload["thumb"] = thumb
-    if caption_entities:
-        payload["caption_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(caption_entities))
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if width:
-        payload["width"] = width
-    if height:
-        payload["height"] = height
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-
-    if has_spoiler is not None:
-        payload["has_spoiler"] = has_spoiler
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    files = _attach_thumb(files, payload, thumb)
+    payload.update(
+        _build_params(
+            ("duration", duration, True),
+            ("caption", caption, True),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("parse_mode", parse_mode, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            (
+                "caption_entities",
+                _entities_json(caption_entities) if caption_entities else None,
+                True,
+            ),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("width", width, True),
+            ("height", height, True),
+            ("protect_content", protect_content, False),
+            ("has_spoiler", has_spoiler, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendAnimation", params=payload, files=files, method="post")
 
 
 async def send_voice(
@@ -936,35 +1104,28 @@ async def send_voice(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendVoice"
     payload = {"chat_id": chat_id}
     files = None
-    if not util.is_string(voice):
+    if not _is_string(voice):
         files = {"voice": voice}
     else:
         payload["voice"] = voice
-    if caption:
-        payload["caption"] = caption
-    if duration:
-        payload["duration"] = duration
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if caption_entities:
-        payload["caption_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(caption_entities))
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    payload.update(
+        _build_params(
+            ("caption", caption, True),
+            ("duration", duration, True),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("parse_mode", parse_mode, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("caption_entities", _entities_json(caption_entities) if caption_entities else None, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendVoice", params=payload, files=files, method="post")
 
 
 async def send_video_note(
@@ -982,41 +1143,30 @@ async def send_video_note(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendVideoNote"
     payload = {"chat_id": chat_id}
     files = None
-    if not util.is_string(data):
+    if not _is_string(data):
         files = {"video_note": data}
     else:
         payload["video_note"] = data
-    if duration:
-        payload["duration"] = duration
     if length and (str(length).isdigit() and int(length) <= 639):
         payload["length"] = length
     else:
         payload["length"] = 639  # seems like it is MAX length size
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if thumb:
-        if not util.is_string(thumb):
-            if files:
-                files["thumb"] = thumb
-            else:
-                files = {"thumb": thumb}
-        else:
-            payload["thumb"] = thumb
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    files = _attach_thumb(files, payload, thumb)
+    payload.update(
+        _build_params(
+            ("duration", duration, True),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendVideoNote", params=payload, files=files, method="post")
 
 
 async def send_audio(
@@ -1038,47 +1188,31 @@ async def send_audio(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendAudio"
     payload = {"chat_id": chat_id}
     files = None
-    if not util.is_string(audio):
+    if not _is_string(audio):
         files = {"audio": audio}
     else:
         payload["audio"] = audio
-    if caption:
-        payload["caption"] = caption
-    if duration:
-        payload["duration"] = duration
-    if performer:
-        payload["performer"] = performer
-    if title:
-        payload["title"] = title
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if thumb:
-        if not util.is_string(thumb):
-            if files:
-                files["thumb"] = thumb
-            else:
-                files = {"thumb": thumb}
-        else:
-            payload["thumb"] = thumb
-    if caption_entities:
-        payload["caption_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(caption_entities))
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    files = _attach_thumb(files, payload, thumb)
+    payload.update(
+        _build_params(
+            ("caption", caption, True),
+            ("duration", duration, True),
+            ("performer", performer, True),
+            ("title", title, True),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("parse_mode", parse_mode, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("caption_entities", _entities_json(caption_entities) if caption_entities else None, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendAudio", params=payload, files=files, method="post")
 
 
 async def send_data(
@@ -1100,73 +1234,62 @@ async def send_data(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = await get_method_by_type(data_type)
+    method_url = get_method_by_type(data_type)
     payload = {"chat_id": chat_id}
     files = None
-    if not util.is_string(data):
+    if not _is_string(data):
         file_data = data
         if visible_file_name:
             file_data = (visible_file_name, data)
         files = {data_type: file_data}
     else:
         payload[data_type] = data
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if parse_mode and data_type == "document":
-        payload["parse_mode"] = parse_mode
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if timeout:
-        payload["timeout"] = timeout
-    if caption:
-        payload["caption"] = caption
-    if thumb:
-        if not util.is_string(thumb):
-            if files:
-                files["thumb"] = thumb
-            else:
-                files = {"thumb": thumb}
-        else:
-            payload["thumb"] = thumb
-    if caption_entities:
-        payload["caption_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(caption_entities))
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    if method_url == "sendDocument" and disable_content_type_detection is not None:
-        payload["disable_content_type_detection"] = disable_content_type_detection
-    _add_message_thread_id(payload, message_thread_id)
+    files = _attach_thumb(files, payload, thumb)
+    payload.update(
+        _build_params(
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("parse_mode", parse_mode if parse_mode and data_type == "document" else None, True),
+            ("disable_notification", disable_notification, False),
+            ("timeout", timeout, True),
+            ("caption", caption, True),
+            ("caption_entities", _entities_json(caption_entities) if caption_entities else None, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            (
+                "disable_content_type_detection",
+                disable_content_type_detection if method_url == "sendDocument" else None,
+                False,
+            ),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
     return await _request(token, method_url, params=payload, files=files, method="post")
 
 
-async def get_method_by_type(data_type):
-    if data_type == "document":
-        return r"sendDocument"
-    if data_type == "sticker":
-        return r"sendSticker"
+_METHOD_BY_TYPE = {
+    "document": "sendDocument",
+    "sticker": "sendSticker",
+}
+
+
+def get_method_by_type(data_type):
+    return _METHOD_BY_TYPE.get(data_type)
 
 
 async def ban_chat_member(token, chat_id, user_id, until_date=None, revoke_messages=None):
-    method_url = "banChatMember"
     payload = {"chat_id": chat_id, "user_id": user_id}
-    if isinstance(until_date, datetime):
-        payload["until_date"] = until_date.timestamp()
-    else:
-        payload["until_date"] = until_date
+    payload["until_date"] = _ts(until_date) if isinstance(until_date, datetime) else until_date
     if revoke_messages is not None:
         payload["revoke_messages"] = revoke_messages
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "banChatMember", params=payload, method="post")
 
 
 async def unban_chat_member(token, chat_id, user_id, only_if_banned):
-    method_url = "unbanChatMember"
     payload = {"chat_id": chat_id, "user_id": user_id}
     if only_if_banned is not None:  # None / True / False
         payload["only_if_banned"] = only_if_banned
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "unbanChatMember", params=payload, method="post")
 
 
 async def restrict_chat_member(
@@ -1177,16 +1300,12 @@ async def restrict_chat_member(
     until_date=None,
     use_independent_chat_permissions=None,
 ):
-    method_url = "restrictChatMember"
     payload = {"chat_id": chat_id, "user_id": user_id, "permissions": permissions.to_json()}
     if use_independent_chat_permissions is not None:
-        permissions["use_independent_chat_permissions"] = use_independent_chat_permissions
+        payload["use_independent_chat_permissions"] = use_independent_chat_permissions
     if until_date is not None:
-        if isinstance(until_date, datetime):
-            payload["until_date"] = until_date.timestamp()
-        else:
-            payload["until_date"] = until_date
-    return await _request(token, method_url, params=payload, method="post")
+        payload["until_date"] = _ts(until_date) if isinstance(until_date, datetime) else until_date
+    return await _request(token, "restrictChatMember", params=payload, method="post")
 
 
 async def promote_chat_member(
@@ -1206,70 +1325,53 @@ async def promote_chat_member(
     can_manage_video_chats=None,
     can_manage_topics=None,
 ):
-    method_url = "promoteChatMember"
     payload = {"chat_id": chat_id, "user_id": user_id}
-    if can_change_info is not None:
-        payload["can_change_info"] = can_change_info
-    if can_post_messages is not None:
-        payload["can_post_messages"] = can_post_messages
-    if can_edit_messages is not None:
-        payload["can_edit_messages"] = can_edit_messages
-    if can_delete_messages is not None:
-        payload["can_delete_messages"] = can_delete_messages
-    if can_invite_users is not None:
-        payload["can_invite_users"] = can_invite_users
-    if can_restrict_members is not None:
-        payload["can_restrict_members"] = can_restrict_members
-    if can_pin_messages is not None:
-        payload["can_pin_messages"] = can_pin_messages
-    if can_promote_members is not None:
-        payload["can_promote_members"] = can_promote_members
-    if is_anonymous is not None:
-        payload["is_anonymous"] = is_anonymous
-    if can_manage_chat is not None:
-        payload["can_manage_chat"] = can_manage_chat
-    if can_manage_video_chats is not None:
-        payload["can_manage_video_chats"] = can_manage_video_chats
-    if can_manage_topics is not None:
-        payload["can_manage_topics"] = can_manage_topics
-    return await _request(token, method_url, params=payload, method="post")
+    payload.update(
+        _build_params(
+            ("can_change_info", can_change_info, False),
+            ("can_post_messages", can_post_messages, False),
+            ("can_edit_messages", can_edit_messages, False),
+            ("can_delete_messages", can_delete_messages, False),
+            ("can_invite_users", can_invite_users, False),
+            ("can_restrict_members", can_restrict_members, False),
+            ("can_pin_messages", can_pin_messages, False),
+            ("can_promote_members", can_promote_members, False),
+            ("is_anonymous", is_anonymous, False),
+            ("can_manage_chat", can_manage_chat, False),
+            ("can_manage_video_chats", can_manage_video_chats, False),
+            ("can_manage_topics", can_manage_topics, False),
+        )
+    )
+    return await _request(token, "promoteChatMember", params=payload, method="post")
 
 
 async def set_chat_administrator_custom_title(token, chat_id, user_id, custom_title):
-    method_url = "setChatAdministratorCustomTitle"
     payload = {"chat_id": chat_id, "user_id": user_id, "custom_title": custom_title}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setChatAdministratorCustomTitle", params=payload, method="post")
 
 
 async def ban_chat_sender_chat(token, chat_id, sender_chat_id):
-    method_url = "banChatSenderChat"
     payload = {"chat_id": chat_id, "sender_chat_id": sender_chat_id}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "banChatSenderChat", params=payload, method="post")
 
 
 async def unban_chat_sender_chat(token, chat_id, sender_chat_id):
-    method_url = "unbanChatSenderChat"
     payload = {"chat_id": chat_id, "sender_chat_id": sender_chat_id}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "unbanChatSenderChat", params=payload, method="post")
 
 
 async def set_chat_permissions(token, chat_id, permissions, use_independent_chat_permissions: Optional[bool] = None):
-    route = "setChatPermissions"
     payload = {"chat_id": chat_id, "permissions": permissions.to_json()}
     if use_independent_chat_permissions is not None:
         payload["use_independent_chat_permissions"] = use_independent_chat_permissions
-    return await _request(token, route, params=payload, method="post")
+    return await _request(token, "setChatPermissions", params=payload, method="post")
 
 
 async def create_chat_invite_link(token, chat_id, name, expire_date, member_limit, creates_join_request):
-    method_url = "createChatInviteLink"
     payload = {"chat_id": chat_id}
 
     if expire_date is not None:
-        if isinstance(expire_date, datetime):
-            payload["expire_date"] = expire_date.timestamp()
-        else:
-            payload["expire_date"] = expire_date
+        payload["expire_date"] = _ts(expire_date) if isinstance(expire_date, datetime) else expire_date
     if member_limit:
         payload["member_limit"] = member_limit
     if creates_join_request is not None:
@@ -1277,18 +1379,14 @@ async def create_chat_invite_link(token, chat_id, name, expire_date, member_limi
     if name:
         payload["name"] = name
 
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "createChatInviteLink", params=payload, method="post")
 
 
 async def edit_chat_invite_link(token, chat_id, invite_link, name, expire_date, member_limit, creates_join_request):
-    method_url = "editChatInviteLink"
     payload = {"chat_id": chat_id, "invite_link": invite_link}
 
     if expire_date is not None:
-        if isinstance(expire_date, datetime):
-            payload["expire_date"] = expire_date.timestamp()
-        else:
-            payload["expire_date"] = expire_date
+        payload["expire_date"] = _ts(expire_date) if isinstance(expire_date, datetime) else expire_date
 
     if member_limit is not None:
         payload["member_limit"] = member_limit
@@ -1297,213 +1395,194 @@ async def edit_chat_invite_link(token, chat_id, invite_link, name, expire_date,
     if creates_join_request is not None:
         payload["creates_join_request"] = creates_join_request
 
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "editChatInviteLink", params=payload, method="post")
 
 
 async def get_custom_emoji_stickers(token, custom_emoji_ids):
-    route = r"getCustomEmojiStickers"
-    return await _request(token, route, params={"custom_emoji_ids": custom_emoji_ids})
+    return await _request(token, "getCustomEmojiStickers", params={"custom_emoji_ids": custom_emoji_ids})
 
 
 async def revoke_chat_invite_link(token, chat_id, invite_link):
-    route = "revokeChatInviteLink"
     payload = {"chat_id": chat_id, "invite_link": invite_link}
-    return await _request(token, route, params=payload, method="post")
+    return await _request(token, "revokeChatInviteLink", params=payload, method="post")
 
 
 async def export_chat_invite_link(token, chat_id):
-    method_url = "exportChatInviteLink"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "exportChatInviteLink", params=payload, method="post")
 
 
 async def approve_chat_join_request(token, chat_id, user_id):
-    method_url = "approveChatJoinRequest"
     payload = {"chat_id": chat_id, "user_id": user_id}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "approveChatJoinRequest", params=payload, method="post")
 
 
 async def decline_chat_join_request(token, chat_id, user_id):
-    method_url = "declineChatJoinRequest"
     payload = {"chat_id": chat_id, "user_id": user_id}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "declineChatJoinRequest", params=payload, method="post")
 
 
 async def set_chat_photo(token, chat_id, photo):
-    method_url = "setChatPhoto"
     payload = {"chat_id": chat_id}
     files = None
-    if util.is_string(photo):
+    if _is_string(photo):
         payload["photo"] = photo
     else:
         files = {"photo": photo}
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    return await _request(token, "setChatPhoto", params=payload, files=files, method="post")
 
 
 async def delete_chat_photo(token, chat_id):
-    method_url = "deleteChatPhoto"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "deleteChatPhoto", params=payload, method="post")
 
 
 async def set_chat_title(token, chat_id, title):
-    method_url = "setChatTitle"
     payload = {"chat_id": chat_id, "title": title}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setChatTitle", params=payload, method="post")
 
 
 async def set_my_description(token, description=None, language_code=None):
-    method_url = r"setMyDescription"
     payload = {}
     if description is not None:
         payload["description"] = description
     if language_code is not None:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setMyDescription", params=payload, method="post")
 
 
+@_single_flight
 async def get_my_description(token, language_code=None):
-    method_url = r"getMyDescription"
     payload = {}
     if language_code:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getMyDescription", params=payload)
 
 
 async def set_my_short_description(token, short_description=None, language_code=None):
-    method_url = r"setMyShortDescription"
     payload = {}
     if short_description is not None:
         payload["short_description"] = short_description
     if language_code is not None:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setMyShortDescription", params=payload, method="post")
 
 
+@_single_flight
 async def get_my_short_description(token, language_code=None):
-    method_url = r"getMyShortDescription"
     payload = {}
     if language_code:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getMyShortDescription", params=payload)
 
 
 async def set_my_name(token, name=None, language_code=None):
-    method_url = r"setMyName"
     payload = {}
     if name is not None:
         payload["name"] = name
     if language_code is not None:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setMyName", params=payload, method="post")
 
 
+@_single_flight
 async def get_my_name(token, language_code=None):
-    method_url = r"getMyName"
     payload = {}
     if language_code is not None:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getMyName", params=payload)
 
 
+@_single_flight
 async def get_my_commands(token, scope=None, language_code=None):
-    method_url = r"getMyCommands"
     payload = {}
     if scope:
         payload["scope"] = scope.to_json()
     if language_code:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getMyCommands", params=payload)
 
 
 async def set_chat_menu_button(token, chat_id=None, menu_button=None):
-    method_url = r"setChatMenuButton"
     payload = {}
     if chat_id:
         payload["chat_id"] = chat_id
     if menu_button:
         payload["menu_button"] = menu_button.to_json()
 
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setChatMenuButton", params=payload, method="post")
 
 
+@_single_flight
 async def get_chat_menu_button(token, chat_id=None):
-    method_url = r"getChatMenuButton"
     payload = {}
     if chat_id:
         payload["chat_id"] = chat_id
 
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "getChatMenuButton", params=payload, method="post")
 
 
 async def set_my_default_administrator_rights(token, rights=None, for_channels=None):
-    method_url = r"setMyDefaultAdministratorRights"
     payload = {}
     if rights:
         payload["rights"] = rights.to_json()
     if for_channels is not None:
         payload["for_channels"] = for_channels
 
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setMyDefaultAdministratorRights", params=payload, method="post")
 
 
+@_single_flight
 async def get_my_default_administrator_rights(token, for_channels=None):
-    method_url = r"getMyDefaultAdministratorRights"
     payload = {}
     if for_channels:
         payload["for_channels"] = for_channels
 
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "getMyDefaultAdministratorRights", params=payload, method="post")
 
 
 async def set_my_commands(token, commands, scope=None, language_code=None):
-    method_url = r"setMyCommands"
-    payload = {"commands": await _convert_list_json_serializable(commands)}
+    payload = {"commands": _convert_list_json_serializable(commands)}
     if scope:
         payload["scope"] = scope.to_json()
     if language_code:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setMyCommands", params=payload, method="post")
 
 
 async def delete_my_commands(token, scope=None, language_code=None):
-    method_url = r"deleteMyCommands"
     payload = {}
     if scope:
         payload["scope"] = scope.to_json()
     if language_code:
         payload["language_code"] = language_code
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "deleteMyCommands", params=payload, method="post")
 
 
 async def set_chat_description(token, chat_id, description):
-    method_url = "setChatDescription"
     payload = {"chat_id": chat_id}
     if description is not None:  # Allow empty strings
         payload["description"] = description
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setChatDescription", params=payload, method="post")
 
 
 async def pin_chat_message(token, chat_id, message_id, disable_notification=None):
-    method_url = "pinChatMessage"
     payload = {"chat_id": chat_id, "message_id": message_id}
     if disable_notification is not None:
         payload["disable_notification"] = disable_notification
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "pinChatMessage", params=payload, method="post")
 
 
 async def unpin_chat_message(token, chat_id, message_id):
-    method_url = "unpinChatMessage"
     payload = {"chat_id": chat_id}
     if message_id:
         payload["message_id"] = message_id
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "unpinChatMessage", params=payload, method="post")
 
 
 async def unpin_all_chat_messages(token, chat_id):
-    method_url = "unpinAllChatMessages"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "unpinAllChatMessages", params=payload, method="post")
 
 
 # Updating messages
@@ -1520,23 +1599,19 @@ async def edit_message_text(
     disable_web_page_preview=None,
     reply_markup=None,
 ):
-    method_url = r"editMessageText"
     payload = {"text": text}
-    if chat_id:
-        payload["chat_id"] = chat_id
-    if message_id:
-        payload["message_id"] = message_id
-    if inline_message_id:
-        payload["inline_message_id"] = inline_message_id
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if entities:
-        payload["entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(entities))
-    if disable_web_page_preview is not None:
-        payload["disable_web_page_preview"] = disable_web_page_preview
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    return await _request(token, method_url, params=payload, method="post")
+    payload.update(
+        _build_params(
+            ("chat_id", chat_id, True),
+            ("message_id", message_id, True),
+            ("inline_message_id", inline_message_id, True),
+            ("parse_mode", parse_mode, True),
+            ("entities", _entities_json(entities) if entities else None, True),
+            ("disable_web_page_preview", disable_web_page_preview, False),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+        )
+    )
+    return await _request(token, "editMessageText", params=payload, method="post")
 
 
 async def edit_message_caption(
@@ -1549,21 +1624,18 @@ async def edit_message_caption(
     caption_entities=None,
     reply_markup=None,
 ):
-    method_url = r"editMessageCaption"
     payload = {"caption": caption}
-    if chat_id:
-        payload["chat_id"] = chat_id
-    if message_id:
-        payload["message_id"] = message_id
-    if inline_message_id:
-        payload["inline_message_id"] = inline_message_id
-    if parse_mode:
-        payload["parse_mode"] = parse_mode
-    if caption_entities:
-        payload["caption_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(caption_entities))
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    return await _request(token, method_url, params=payload, method="post")
+    payload.update(
+        _build_params(
+            ("chat_id", chat_id, True),
+            ("message_id", message_id, True),
+            ("inline_message_id", inline_message_id, True),
+            ("parse_mode", parse_mode, True),
+            ("caption_entities", _entities_json(caption_entities) if caption_entities else None, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+        )
+    )
+    return await _request(token, "editMessageCaption", params=payload, method="post")
 
 
 async def edit_message_media(
@@ -1574,40 +1646,34 @@ async def edit_message_media(
     inline_message_id=None,
     reply_markup=None,
 ):
-    method_url = r"editMessageMedia"
-    media_json, file = await convert_input_media(media)
+    media_json, file = convert_input_media(media)
     payload = {"media": media_json}
-    if chat_id:
-        payload["chat_id"] = chat_id
-    if message_id:
-        payload["message_id"] = message_id
-    if inline_message_id:
-        payload["inline_message_id"] = inline_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    return await _request(token, method_url, params=payload, files=file, method="post" if file else "get")
+    payload.update(
+        _build_params(
+            ("chat_id", chat_id, True),
+            ("message_id", message_id, True),
+            ("inline_message_id", inline_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+        )
+    )
+    return await _request(token, "editMessageMedia", params=payload, files=file, method="post" if file else "get")
 
 
 async def edit_message_reply_markup(token, chat_id=None, message_id=None, inline_message_id=None, reply_markup=None):
-    method_url = r"editMessageReplyMarkup"
-    payload = {}
-    if chat_id:
-        payload["chat_id"] = chat_id
-    if message_id:
-        payload["message_id"] = message_id
-    if inline_message_id:
-        payload["inline_message_id"] = inline_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    return await _request(token, method_url, params=payload, method="post")
+    payload = _build_params(
+        ("chat_id", chat_id, True),
+        ("message_id", message_id, True),
+        ("inline_message_id", inline_message_id, True),
+        ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+    )
+    return await _request(token, "editMessageReplyMarkup", params=payload, method="post")
 
 
 async def delete_message(token, chat_id, message_id, timeout=None):
-    method_url = r"deleteMessage"
     payload = {"chat_id": chat_id, "message_id": message_id}
     if timeout:
         payload["timeout"] = timeout
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "deleteMessage", params=payload, method="post")
 
 
 # Game
@@ -1625,22 +1691,19 @@ async def send_game(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendGame"
     payload = {"chat_id": chat_id, "game_short_name": game_short_name}
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if timeout:
-        payload["timeout"] = timeout
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("disable_notification", disable_notification, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("timeout", timeout, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendGame", params=payload)
 
 
 # https://core.telegram.org/bots/api#setgamescore
@@ -1666,7 +1729,6 @@ async def set_game_score(
     :param inline_message_id: (Optional, required if chat_id and message_id are not specified) Identifier of the inline message
     :return:
     """
-    method_url = r"setGameScore"
     payload = {"user_id": user_id, "score": score}
     if force is not None:
         payload["force"] = force
@@ -1678,7 +1740,7 @@ async def set_game_score(
         payload["inline_message_id"] = inline_message_id
     if disable_edit_message is not None:
         payload["disable_edit_message"] = disable_edit_message
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "setGameScore", params=payload)
 
 
 # https://core.telegram.org/bots/api#getgamehighscores
@@ -1693,7 +1755,6 @@ async def get_game_high_scores(token, user_id, chat_id=None, message_id=None, in
     :param inline_message_id: (Optional, required if chat_id and message_id are not specified) Identifier of the inline message
     :return:
     """
-    method_url = r"getGameHighScores"
     payload = {"user_id": user_id}
     if chat_id:
         payload["chat_id"] = chat_id
@@ -1701,7 +1762,7 @@ async def get_game_high_scores(token, user_id, chat_id=None, message_id=None, in
         payload["message_id"] = message_id
     if inline_message_id:
         payload["inline_message_id"] = inline_message_id
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "getGameHighScores", params=payload)
 
 
 # Payments (https://core.telegram.org/bots/api#payments)
@@ -1773,7 +1834,6 @@ async def send_invoice(
     :param protect_content:
     :return:
     """
-    method_url = r"sendInvoice"
     payload = {
         "chat_id": chat_id,
         "title": title,
@@ -1781,52 +1841,35 @@ async def send_invoice(
         "payload": invoice_payload,
         "provider_token": provider_token,
         "currency": currency,
-        "prices": await _convert_list_json_serializable(prices),
+        "prices": _convert_list_json_serializable(prices),
     }
-    if start_parameter:
-        payload["start_parameter"] = start_parameter
-    if photo_url:
-        payload["photo_url"] = photo_url
-    if photo_size:
-        payload["photo_size"] = photo_size
-    if photo_width:
-        payload["photo_width"] = photo_width
-    if photo_height:
-        payload["photo_height"] = photo_height
-    if need_name is not None:
-        payload["need_name"] = need_name
-    if need_phone_number is not None:
-        payload["need_phone_number"] = need_phone_number
-    if need_email is not None:
-        payload["need_email"] = need_email
-    if need_shipping_address is not None:
-        payload["need_shipping_address"] = need_shipping_address
-    if send_phone_number_to_provider is not None:
-        payload["send_phone_number_to_provider"] = send_phone_number_to_provider
-    if send_email_to_provider is not None:
-        payload["send_email_to_provider"] = send_email_to_provider
-    if is_flexible is not None:
-        payload["is_flexible"] = is_flexible
-    if disable_notification is not None:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if provider_data:
-        payload["provider_data"] = provider_data
-    if timeout:
-        payload["timeout"] = timeout
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if max_tip_amount is not None:
-        payload["max_tip_amount"] = max_tip_amount
-    if suggested_tip_amounts is not None:
-        payload["suggested_tip_amounts"] = json.dumps(suggested_tip_amounts)
-    if protect_content is not None:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("start_parameter", start_parameter, True),
+            ("photo_url", photo_url, True),
+            ("photo_size", photo_size, True),
+            ("photo_width", photo_width, True),
+            ("photo_height", photo_height, True),
+            ("need_name", need_name, False),
+            ("need_phone_number", need_phone_number, False),
+            ("need_email", need_email, False),
+            ("need_shipping_address", need_shipping_address, False),
+            ("send_phone_number_to_provider", send_phone_number_to_provider, False),
+            ("send_email_to_provider", send_email_to_provider, False),
+            ("is_flexible", is_flexible, False),
+            ("disable_notification", disable_notification, False),
+            ("reply_to_message_id", reply_to_message_id, True),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup else None, True),
+            ("provider_data", provider_data, True),
+            ("timeout", timeout, True),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("max_tip_amount", max_tip_amount, False),
+            ("suggested_tip_amounts", _serialize_list(suggested_tip_amounts), False),
+            ("protect_content", protect_content, False),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendInvoice", params=payload)
 
 
 async def answer_shipping_query(token, shipping_query_id, ok, shipping_options=None, error_message=None):
@@ -1839,13 +1882,12 @@ async def answer_shipping_query(token, shipping_query_id, ok, shipping_options=N
     :param error_message: Required if ok is False. Error message in human readable form that explains why it is impossible to complete the order (e.g. "Sorry, delivery to your desired address is unavailable'). Telegram will display this message to the user.
     :return:
     """
-    method_url = "answerShippingQuery"
     payload = {"shipping_query_id": shipping_query_id, "ok": ok}
     if shipping_options:
-        payload["shipping_options"] = await _convert_list_json_serializable(shipping_options)
+        payload["shipping_options"] = _convert_list_json_serializable(shipping_options)
     if error_message:
         payload["error_message"] = error_message
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "answerShippingQuery", params=payload)
 
 
 async def answer_pre_checkout_query(token, pre_checkout_query_id, ok, error_message=None):
@@ -1857,11 +1899,10 @@ async def answer_pre_checkout_query(token, pre_checkout_query_id, ok, error_mess
     :param error_message: Required if ok is False. Error message in human readable form that explains the reason for failure to proceed with the checkout (e.g. "Sorry, somebody just bought the last of our amazing black T-shirts while you were busy filling out your payment details. Please choose a different color or garment!"). Telegram will display this message to the user.
     :return:
     """
-    method_url = "answerPreCheckoutQuery"
     payload = {"pre_checkout_query_id": pre_checkout_query_id, "ok": ok}
     if error_message:
         payload["error_message"] = error_message
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "answerPreCheckoutQuery", params=payload)
 
 
 # InlineQuery
@@ -1880,7 +1921,6 @@ async def answer_callback_query(token, callback_query_id, text=None, show_alert=
     :param cache_time: (Optional) The maximum amount of time in seconds that the result of the callback query may be cached client-side. Telegram apps will support caching starting in version 3.14. Defaults to 0.
     :return:
     """
-    method_url = "answerCallbackQuery"
     payload = {"callback_query_id": callback_query_id}
     if text:
         payload["text"] = text
@@ -1890,7 +1930,7 @@ async def answer_callback_query(token, callback_query_id, text=None, show_alert=
         payload["url"] = url
     if cache_time is not None:
         payload["cache_time"] = cache_time
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "answerCallbackQuery", params=payload, method="post")
 
 
 async def answer_inline_query(
@@ -1903,34 +1943,39 @@ async def answer_inline_query(
     switch_pm_text=None,
     switch_pm_parameter=None,
 ):
-    method_url = "answerInlineQuery"
     payload = {
         "inline_query_id": inline_query_id,
-        "results": await _convert_list_json_serializable(results),
+        "results": _convert_list_json_serializable(results),
     }
-    if cache_time is not None:
-        payload["cache_time"] = cache_time
-    if is_personal is not None:
-        payload["is_personal"] = is_personal
-    if next_offset is not None:
-        payload["next_offset"] = next_offset
-    if switch_pm_text:
-        payload["switch_pm_text"] = switch_pm_text
-    if switch_pm_parameter:
-        payload["switch_pm_parameter"] = switch_pm_parameter
-    return await _request(token, method_url, params=payload, method="post")
+    payload.update(
+        _build_params(
+            ("cache_time", cache_time, False),
+            ("is_personal", is_personal, False),
+            ("next_offset", next_offset, False),
+            ("switch_pm_text", switch_pm_text, True),
+            ("switch_pm_parameter", switch_pm_parameter, True),
+        )
+    )
+    return await _request(token, "answerInlineQuery", params=payload, method="post")
 
 
 async def get_sticker_set(token, name):
-    method_url = "getStickerSet"
-    return await _request(token, method_url, params={"name": name})
+    return await _request(token, "getStickerSet", params={"name": name})
 
 
 async def upload_sticker_file(token, user_id, png_sticker):
-    method_url = "uploadStickerFile"
     payload = {"user_id": user_id}
     files = {"png_sticker": png_sticker}
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    return await _request(token, "uploadStickerFile", params=payload, files=files, method="post")
+
+
+def _pick_sticker(png_sticker, webm_sticker, tgs_sticker) -> tuple:
+    """Select the (field name, value) pair for the sticker format provided, keeping the
+    name and the value consistent even if a caller passes several formats at once."""
+    for stype, sticker in (("png_sticker", png_sticker), ("webm_sticker", webm_sticker), ("tgs_sticker", tgs_sticker)):
+        if sticker:
+            return stype, sticker
+    return "tgs_sticker", None
 
 
 async def create_new_sticker_set(
@@ -1945,17 +1990,10 @@ async def create_new_sticker_set(
     webm_sticker=None,
     sticker_type=None,
 ):
-    route = "createNewStickerSet"
     payload = {"user_id": user_id, "name": name, "title": title, "emojis": emojis}
-    if png_sticker:
-        stype = "png_sticker"
-    elif webm_sticker:
-        stype = "webm_sticker"
-    else:
-        stype = "tgs_sticker"
-    sticker = png_sticker or tgs_sticker or webm_sticker
+    stype, sticker = _pick_sticker(png_sticker, webm_sticker, tgs_sticker)
     files = None
-    if not util.is_string(sticker):
+    if not _is_string(sticker):
         files = {stype: sticker}
     else:
         payload[stype] = sticker
@@ -1965,22 +2003,14 @@ async def create_new_sticker_set(
         payload["webm_sticker"] = webm_sticker
     if sticker_type:
         payload["sticker_type"] = sticker_type
-    return await _request(token, route, params=payload, files=files, method="post")
+    return await _request(token, "createNewStickerSet", params=payload, files=files, method="post")
 
 
 async def add_sticker_to_set(token, user_id, name, emojis, png_sticker, tgs_sticker, mask_position, webm_sticker):
-    method_url = "addStickerToSet"
     payload = {"user_id": user_id, "name": name, "emojis": emojis}
-    if png_sticker:
-        stype = "png_sticker"
-    elif webm_sticker:
-        stype = "webm_sticker"
-    else:
-        stype = "tgs_sticker"
+    stype, sticker = _pick_sticker(png_sticker, webm_sticker, tgs_sticker)
     files = None
-    sticker = png_sticker or tgs_sticker or webm_sticker
-
-    if not util.is_string(sticker):
+    if not _is_string(sticker):
         files = {stype: sticker}
     else:
         payload[stype] = sticker
@@ -1989,19 +2019,17 @@ async def add_sticker_to_set(token, user_id, name, emojis, png_sticker, tgs_stic
 
     if webm_sticker:
         payload["webm_sticker"] = webm_sticker
-    return await _request(token, method_url, params=payload, files=files, method="post")
+    return await _request(token, "addStickerToSet", params=payload, files=files, method="post")
 
 
 async def set_sticker_position_in_set(token, sticker, position):
-    method_url = "setStickerPositionInSet"
     payload = {"sticker": sticker, "position": position}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "setStickerPositionInSet", params=payload, method="post")
 
 
 async def delete_sticker_from_set(token, sticker):
-    method_url = "deleteStickerFromSet"
     payload = {"sticker": sticker}
-    return await _request(token, method_url, params=payload, method="post")
+    return await _request(token, "deleteStickerFromSet", params=payload, method="post")
 
 
 async def create_invoice_link(
@@ -2027,44 +2055,33 @@ async def create_invoice_link(
     send_email_to_provider=None,
     is_flexible=None,
 ):
-    route = r"createInvoiceLink"
     payload = {
         "title": title,
         "description": description,
         "payload": payload,
         "provider_token": provider_token,
         "currency": currency,
-        "prices": await _convert_list_json_serializable(prices),
+        "prices": _convert_list_json_serializable(prices),
     }
-    if max_tip_amount:
-        payload["max_tip_amount"] = max_tip_amount
-    if suggested_tip_amounts:
-        payload["suggested_tip_amounts"] = json.dumps(suggested_tip_amounts)
-    if provider_data:
-        payload["provider_data"] = provider_data
-    if photo_url:
-        payload["photo_url"] = photo_url
-    if photo_size:
-        payload["photo_size"] = photo_size
-    if photo_width:
-        payload["photo_width"] = photo_width
-    if photo_height:
-        payload["photo_height"] = photo_height
-    if need_name is not None:
-        payload["need_name"] = need_name
-    if need_phone_number is not None:
-        payload["need_phone_number"] = need_phone_number
-    if need_email is not None:
-        payload["need_email"] = need_email
-    if need_shipping_address is not None:
-        payload["need_shipping_address"] = need_shipping_address
-    if send_phone_number_to_provider is not None:
-        payload["send_phone_number_to_provider"] = send_phone_number_to_provider
-    if send_email_to_provider is not None:
-        payload["send_email_to_provider"] = send_email_to_provider
-    if is_flexible is not None:
-        payload["is_flexible"] = is_flexible
-    return await _request(token, route, params=payload, method="post")
+    payload.update(
+        _build_params(
+            ("max_tip_amount", max_tip_amount, True),
+            ("suggested_tip_amounts", _serialize_list(suggested_tip_amounts) if suggested_tip_amounts else None, True),
+            ("provider_data", provider_data, True),
+            ("photo_url", photo_url, True),
+            ("photo_size", photo_size, True),
+            ("photo_width", photo_width, True),
+            ("photo_height", photo_height, True),
+            ("need_name", need_name, False),
+            ("need_phone_number", need_phone_number, False),
+            ("need_email", need_email, False),
+            ("need_shipping_address", need_shipping_address, False),
+            ("send_phone_number_to_provider", send_phone_number_to_provider, False),
+            ("send_email_to_provider", send_email_to_provider, False),
+            ("is_flexible", is_flexible, False),
+        )
+    )
+    return await _request(token, "createInvoiceLink", params=payload, method="post")
 
 
 # noinspection PyShadowingBuiltins
@@ -2091,143 +2108,118 @@ async def send_poll(
     protect_content=None,
     message_thread_id: Optional[int] = None,
 ):
-    method_url = r"sendPoll"
     payload = {
-        "chat_id": str(chat_id),
+        "chat_id": chat_id,
         "question": question,
-        "options": json.dumps(await _convert_poll_options(options)),
+        "options": _dumps(_convert_poll_options(options)),
     }
 
-    if is_anonymous is not None:
-        payload["is_anonymous"] = is_anonymous
-    if type is not None:
-        payload["type"] = type
-    if allows_multiple_answers is not None:
-        payload["allows_multiple_answers"] = allows_multiple_answers
-    if correct_option_id is not None:
-        payload["correct_option_id"] = correct_option_id
-    if explanation is not None:
-        payload["explanation"] = explanation
-    if explanation_parse_mode is not None:
-        payload["explanation_parse_mode"] = explanation_parse_mode
-    if open_period is not None:
-        payload["open_period"] = open_period
-    if close_date is not None:
-        if isinstance(close_date, datetime):
-            payload["close_date"] = close_date.timestamp()
-        else:
-            payload["close_date"] = close_date
-    if is_closed is not None:
-        payload["is_closed"] = is_closed
-
-    if disable_notification:
-        payload["disable_notification"] = disable_notification
-    if reply_to_message_id is not None:
-        payload["reply_to_message_id"] = reply_to_message_id
-    if allow_sending_without_reply is not None:
-        payload["allow_sending_without_reply"] = allow_sending_without_reply
-    if reply_markup is not None:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    if timeout:
-        payload["timeout"] = timeout
-    if explanation_entities:
-        payload["explanation_entities"] = json.dumps(types.MessageEntity.to_list_of_dicts(explanation_entities))
-    if protect_content:
-        payload["protect_content"] = protect_content
-    _add_message_thread_id(payload, message_thread_id)
-    return await _request(token, method_url, params=payload)
+    payload.update(
+        _build_params(
+            ("is_anonymous", is_anonymous, False),
+            ("type", type, False),
+            ("allows_multiple_answers", allows_multiple_answers, False),
+            ("correct_option_id", correct_option_id, False),
+            ("explanation", explanation, False),
+            ("explanation_parse_mode", explanation_parse_mode, False),
+            ("open_period", open_period, False),
+            ("close_date", _ts(close_date) if isinstance(close_date, datetime) else close_date, False),
+            ("is_closed", is_closed, False),
+            ("disable_notification", disable_notification, True),
+            ("reply_to_message_id", reply_to_message_id, False),
+            ("allow_sending_without_reply", allow_sending_without_reply, False),
+            ("reply_markup", _convert_markup(reply_markup) if reply_markup is not None else None, False),
+            ("timeout", timeout, True),
+            ("explanation_entities", _entities_json(explanation_entities) if explanation_entities else None, True),
+            ("protect_content", protect_content, True),
+            ("message_thread_id", message_thread_id, False),
+        )
+    )
+    return await _request(token, "sendPoll", params=payload)
 
 
 async def create_forum_topic(token, chat_id, name, icon_color=None, icon_custom_emoji_id=None):
-    method_url = r"createForumTopic"
     payload = {"chat_id": chat_id, "name": name}
     if icon_color:
         payload["icon_color"] = icon_color
     if icon_custom_emoji_id:
         payload["icon_custom_emoji_id"] = icon_custom_emoji_id
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "createForumTopic", params=payload)
 
 
 async def edit_forum_topic(token, chat_id, message_thread_id, name=None, icon_custom_emoji_id=None):
-    method_url = r"editForumTopic"
     payload = {"chat_id": chat_id, "message_thread_id": message_thread_id}
     if name is not None:
         payload["name"] = name
     if icon_custom_emoji_id is not None:
         payload["icon_custom_emoji_id"] = icon_custom_emoji_id
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "editForumTopic", params=payload)
 
 
 async def close_forum_topic(token, chat_id, message_thread_id):
-    method_url = r"closeForumTopic"
     payload = {"chat_id": chat_id, "message_thread_id": message_thread_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "closeForumTopic", params=payload)
 
 
 async def reopen_forum_topic(token, chat_id, message_thread_id):
-    method_url = r"reopenForumTopic"
     payload = {"chat_id": chat_id, "message_thread_id": message_thread_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "reopenForumTopic", params=payload)
 
 
 async def delete_forum_topic(token, chat_id, message_thread_id):
-    method_url = r"deleteForumTopic"
     payload = {"chat_id": chat_id, "message_thread_id": message_thread_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "deleteForumTopic", params=payload)
 
 
 async def unpin_all_forum_topic_messages(token, chat_id, message_thread_id):
-    method_url = r"unpinAllForumTopicMessages"
     payload = {"chat_id": chat_id, "message_thread_id": message_thread_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "unpinAllForumTopicMessages", params=payload)
 
 
 async def get_forum_topic_icon_stickers(token):
-    method_url = r"getForumTopicIconStickers"
-    return await _request(token, method_url)
+    return await _request(token, "getForumTopicIconStickers")
 
 
 async def edit_general_forum_topic(token, chat_id, name):
-    method_url = r"editGeneralForumTopic"
     payload = {"chat_id": chat_id, "name": name}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "editGeneralForumTopic", params=payload)
 
 
 async def close_general_forum_topic(token, chat_id):
-    method_url = r"closeGeneralForumTopic"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "closeGeneralForumTopic", params=payload)
 
 
 async def reopen_general_forum_topic(token, chat_id):
-    method_url = r"reopenGeneralForumTopic"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "reopenGeneralForumTopic", params=payload)
 
 
 async def hide_general_forum_topic(token, chat_id):
-    method_url = r"hideGeneralForumTopic"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "hideGeneralForumTopic", params=payload)
 
 
 async def unhide_general_forum_topic(token, chat_id):
-    method_url = r"unhideGeneralForumTopic"
     payload = {"chat_id": chat_id}
-    return await _request(token, method_url, params=payload)
+    return await _request(token, "unhideGeneralForumTopic", params=payload)
+
 
+def _serialize_list(values) -> Optional[str]:
+    """JSON-encode a plain list, passing through None and pre-serialized strings."""
+    if values is None or isinstance(values, str):
+        return values
+    return _dumps(values)
 
-async def _convert_list_json_serializable(results):
-    ret = ""
-    for r in results:
-        if isinstance(r, types.JsonSerializable):
-            ret = ret + r.to_json() + ","
-    if len(ret) > 0:
-        ret = ret[:-1]
-    return "[" + ret + "]"
 
+def _convert_list_json_serializable(results):
+    if isinstance(results, str):
+        # already-serialized JSON array, e.g. an invoice price list reused across many sends
+        return results
+    return "[" + ",".join(r.to_json() for r in results if isinstance(r, types.JsonSerializable)) + "]"
 
-async def _convert_entites(entites):
+
+def _convert_entites(entites):
     if entites is None:
         return None
     elif len(entites) == 0:
@@ -2238,40 +2230,41 @@ async def _convert_entites(entites):
         return entites
 
 
-async def _convert_poll_options(poll_options):
-    if poll_options is None:
-        return None
-    elif len(poll_options) == 0:
-        return []
-    elif isinstance(poll_options[0], str):
+def _convert_poll_options(poll_options):
+    if not poll_options:
+        return poll_options
+    if isinstance(poll_options[0], str):
         # Compatibility mode with previous bug when only list of string was accepted as poll_options
         return poll_options
-    elif isinstance(poll_options[0], types.PollOption):
+    try:
+        # EAFP fast path for the common all-PollOption case
         return [option.text for option in poll_options]
-    else:
+    except AttributeError:
         return poll_options
 
 
-async def convert_input_media(media):
+def convert_input_media(media):
     if isinstance(media, types.InputMedia):
         return media.convert_input_media()
     return None, None
 
 
-async def convert_input_media_array(array):
+def convert_input_media_array(array):
+    """Serialize a media group in a single _dumps call over the collected dicts instead
+    of encoding items one by one."""
     media = []
     files = {}
     for input_media in array:
         if isinstance(input_media, types.InputMedia):
             media_dict = input_media.to_dict()
             if media_dict["media"].startswith("attach://"):
-                key = media_dict["media"].replace("attach://", "")
+                key = media_dict["media"][len("attach://") :]
                 files[key] = input_media.media
             media.append(media_dict)
-    return json.dumps(media), files
+    return _dumps(media), files
 
 
-async def _no_encode(func):
+def _no_encode(func):
     def wrapper(key, val):
         if key == "filename":
             return "{0}={1}".format(key, val)
@@ -2282,11 +2275,10 @@ async def _no_encode(func):
 
 
 async def stop_poll(token, chat_id, message_id, reply_markup=None):
-    method_url = r"stopPoll"
-    payload = {"chat_id": str(chat_id), "message_id": message_id}
+    payload = {"chat_id": chat_id, "message_id": message_id}
     if reply_markup:
-        payload["reply_markup"] = await _convert_markup(reply_markup)
-    return await _request(token, method_url, params=payload)
+        payload["reply_markup"] = _convert_markup(reply_markup)
+    return await _request(token, "stopPoll", params=payload)
 
 
 class ApiException(Exception):
@@ -2295,16 +2287,26 @@ class ApiException(Exception):
     It contains aiohttp client response in case you want to do some advanced error handling.
     """
 
-    API_URL_REGEX = re.compile(r"api\.telegram\.org/bot(?P<token>.*?)/.*")
+    API_URL_REGEX = re.compile(r"api\.telegram\.org/bot(?P<token>.*?)/.*")  # kept for backward compat
 
-    def __init__(self, msg: str, response: aiohttp.ClientResponse):
-        match = self.API_URL_REGEX.search(msg)
-        if match is not None:
-            bot_token = match.group("token")
-            masked_token = bot_token[:3] + "*" * (len(bot_token) - 3)
-            msg = msg.replace(bot_token, masked_token)
+    _TOKEN_MARKER = "api.telegram.org/bot"
+
+    @classmethod
+    def _redact_token(cls, msg: str) -> str:
+        # plain find/slice instead of a regex search: exceptions come in bursts during
+        # flood waits and most messages don't contain an API URL at all
+        start = msg.find(cls._TOKEN_MARKER)
+        if start != -1:
+            start += len(cls._TOKEN_MARKER)
+            end = msg.find("/", start)
+            bot_token = msg[start:end] if end != -1 else msg[start:]
+            if bot_token:
+                masked_token = bot_token[:3] + "*" * (len(bot_token) - 3)
+                msg = msg.replace(bot_token, masked_token)
+        return msg
 
-        super().__init__(msg)
+    def __init__(self, msg: str, response: aiohttp.ClientResponse):
+        super().__init__(self._redact_token(msg))
         self.response = response
 
 
@@ -2346,15 +2348,21 @@ class ApiHTTPException(ApiException):
             self.error_parameters = None
             self.error_description = None
 
+        # message formatting (with token redaction) is deferred to __str__: these
+        # exceptions are raised in bursts during flood waits and the retry loop
+        # usually handles them without ever rendering the message
+        self._response_json = response_json
+        Exception.__init__(self)
+        self.response = response
+
+    def __str__(self) -> str:
+        response = self.response
         error_title = (
             self.error_description
             if self.error_description is not None
-            else f"JSON response misses 'description' field: {response_json}"
-        )
-        super().__init__(
-            f"{error_title} ({response.url} responded with {response.status} {response.reason})",
-            response,
+            else f"JSON response misses 'description' field: {self._response_json}"
         )
+        return self._redact_token(f"{error_title} ({response.url} responded with {response.status} {response.reason})")
 
 
 class ApiInvalidJSONException(ApiException):
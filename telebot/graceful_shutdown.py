@@ -1,7 +1,8 @@
 import contextlib
 import functools
+import inspect
 import logging
-from typing import Awaitable, Callable, TypeVar
+from typing import Awaitable, Callable, TypeVar, Union
 from weakref import WeakSet
 
 logger = logging.getLogger(__name__)
@@ -11,7 +12,7 @@ class GracefulShutdownCondition:
 
     instances: WeakSet["GracefulShutdownCondition"] = WeakSet()
 
-    def __init__(self, predicate: Callable[[], Awaitable[bool]], description: str) -> None:
+    def __init__(self, predicate: Callable[[], Union[bool, Awaitable[bool]]], description: str) -> None:
         self.predicate = predicate
         self.description = description
 
@@ -21,7 +22,10 @@ class GracefulShutdownCondition:
         return instance
 
     async def is_ready(self) -> bool:
-        return await self.predicate()
+        result = self.predicate()
+        if inspect.isawaitable(result):
+            result = await result
+        return bool(result)
 
 
 FunctionT = TypeVar("FunctionT", bound=Callable)
@@ -53,16 +57,27 @@ class PreventShutdown(GracefulShutdownCondition):
 
     """
 
+    _active_count = 0  # class-wide count of currently active prevention contexts
+
     def __init__(self, reason: str):
-        self._is_preventing_shutdown = False
+        self._prevention_depth = 0
         self._reason = reason
         super().__init__(
             predicate=self.is_ready_to_shutdown,
             description=f"Preventing shutdown, {self._reason}",
         )
 
-    async def is_ready_to_shutdown(self) -> bool:
-        return not self._is_preventing_shutdown
+    @classmethod
+    def active_count(cls) -> int:
+        return cls._active_count
+
+    def _set_depth(self, depth: int) -> None:
+        if (depth > 0) != (self._prevention_depth > 0):
+            PreventShutdown._active_count += 1 if depth > 0 else -1
+        self._prevention_depth = depth
+
+    def is_ready_to_shutdown(self) -> bool:
+        return self._prevention_depth == 0
 
     def __call__(self, function: FunctionT) -> FunctionT:
         """Async function decorator, preventing shutdown for the duration of its execution"""
@@ -76,19 +91,23 @@ class PreventShutdown(GracefulShutdownCondition):
 
     @contextlib.asynccontextmanager
     async def allow_shutdown(self):
-        initial_state = self._is_preventing_shutdown
-        logger.debug(f"Entering negated shutdown prevention context ({self._reason = }, {initial_state = })")
-        self._is_preventing_shutdown = False
+        initial_depth = self._prevention_depth
+        logger.debug(
+            "Entering negated shutdown prevention context (reason=%r, initial depth: %r)", self._reason, initial_depth
+        )
+        self._set_depth(0)
         yield
-        logger.debug(f"Exiting negated shutdown prevention context ({self._reason = }, restoring {initial_state = })")
-        self._is_preventing_shutdown = initial_state
+        logger.debug(
+            "Exiting negated shutdown prevention context (reason=%r, restoring depth %r)", self._reason, initial_depth
+        )
+        self._set_depth(initial_depth)
 
     async def __aenter__(self):
-        logger.debug(f"Entering shutdown prevention context ({self._reason = })")
-        self._is_preventing_shutdown = True
+        logger.debug("Entering shutdown prevention context (reason=%r)", self._reason)
+        self._set_depth(self._prevention_depth + 1)
         return None
 
     async def __aexit__(self, *args, **kwargs):
-        logger.debug(f"Exiting shutdown prevention context ({self._reason = })")
-        self._is_preventing_shutdown = False
+        logger.debug("Exiting shutdown prevention context (reason=%r)", self._reason)
+        self._set_depth(max(0, self._prevention_depth - 1))
         return None
@@ -7,7 +7,18 @@ from io import BytesIO, IOBase
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Union, get_args
 
-import ujson as json  # type: ignore
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import ujson  # type: ignore
+
+    _dumps = ujson.dumps
+    _loads = ujson.loads
 
 from telebot import util
 from telebot.metrics import MessageInfo, TelegramUpdateMetrics, UserInfo
@@ -75,7 +86,7 @@ class JsonDeserializable(object):
     def ensure_json_dict(json_: Union[str, dict], copy_dict=True) -> dict:
         """
         Checks whether json_type is a dict or a string. If it is already a dict, it is returned as-is.
-        If it is not, it is converted to a dict by means of json.loads(json_type)
+        If it is not, it is converted to a dict by means of _loads(json_type)
 
         :param json_type: input json or parsed dict
         :param dict_copy: if dict is passed and it is changed outside - should be True!
@@ -84,7 +95,7 @@ class JsonDeserializable(object):
         if isinstance(json_, dict):
             return json_.copy() if copy_dict else json_
         elif isinstance(json_, str):
-            return json.loads(json_)
+            return _loads(json_)
         else:
             raise ValueError("json_type should be a json dict or string.")
 
@@ -326,7 +337,7 @@ class User(JsonDeserializable, Dictionaryable, JsonSerializable):
         return full_name
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {
@@ -555,7 +566,7 @@ class Message(JsonDeserializable):
         if "caption" in obj:
             opts["caption"] = obj["caption"]
         if "contact" in obj:
-            opts["contact"] = Contact.de_json(json.dumps(obj["contact"]))
+            opts["contact"] = Contact.de_json(_dumps(obj["contact"]))
             content_type = "contact"
         if "location" in obj:
             opts["location"] = Location.de_json(obj["location"])
@@ -886,10 +897,7 @@ class Message(JsonDeserializable):
 class MessageEntity(Dictionaryable, JsonSerializable, JsonDeserializable):
     @staticmethod
     def to_list_of_dicts(entity_list) -> Union[List[Dict], None]:
-        res = []
-        for e in entity_list:
-            res.append(MessageEntity.to_dict(e))
-        return res or None
+        return [MessageEntity.to_dict(e) for e in entity_list] or None
 
     @classmethod
     def de_json(cls, json_string):
@@ -910,7 +918,7 @@ class MessageEntity(Dictionaryable, JsonSerializable, JsonDeserializable):
         self.custom_emoji_id: str = custom_emoji_id
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {
@@ -923,6 +931,12 @@ class MessageEntity(Dictionaryable, JsonSerializable, JsonDeserializable):
             "custom_emoji_id": self.custom_emoji_id,
         }
 
+    def __eq__(self, other):
+        return isinstance(other, MessageEntity) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self.type, self.offset, self.length, self.url, self.language, self.custom_emoji_id))
+
 
 TiedToChat = Union[ChatMemberUpdated, ChatJoinRequest, Message]
 
@@ -940,7 +954,7 @@ class Dice(JsonSerializable, Dictionaryable, JsonDeserializable):
         self.emoji: str = emoji
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {"value": self.value, "emoji": self.emoji}
@@ -1130,7 +1144,7 @@ class Location(JsonDeserializable, JsonSerializable, Dictionaryable):
         self.proximity_alert_radius: int = proximity_alert_radius
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {
@@ -1218,7 +1232,7 @@ class ForceReply(JsonSerializable):
             json_dict["selective"] = self.selective
         if self.input_field_placeholder:
             json_dict["input_field_placeholder"] = self.input_field_placeholder
-        return json.dumps(json_dict)
+        return _dumps(json_dict)
 
 
 class ReplyKeyboardRemove(JsonSerializable):
@@ -1229,7 +1243,7 @@ class ReplyKeyboardRemove(JsonSerializable):
         json_dict = {"remove_keyboard": True}
         if self.selective:
             json_dict["selective"] = self.selective
-        return json.dumps(json_dict)
+        return _dumps(json_dict)
 
 
 class WebAppInfo(JsonDeserializable):
@@ -1339,7 +1353,7 @@ class ReplyKeyboardMarkup(JsonSerializable, Dictionaryable):
         https://core.telegram.org/bots/api#replykeyboardmarkup
         :return:
         """
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class KeyboardButtonPollType(Dictionaryable):
@@ -1471,7 +1485,7 @@ class KeyboardButton(Dictionaryable, JsonSerializable):
         self.request_chat = request_chat
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = {"text": self.text}
@@ -1563,7 +1577,7 @@ class InlineKeyboardMarkup(Dictionaryable, JsonSerializable, JsonDeserializable)
         https://core.telegram.org/bots/api#inlinekeyboardmarkup
         :return:
         """
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = dict()
@@ -1616,7 +1630,7 @@ class InlineKeyboardButton(Dictionaryable, JsonSerializable, JsonDeserializable)
         self.login_url: LoginUrl = login_url
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = {"text": self.text}
@@ -1654,7 +1668,7 @@ class LoginUrl(Dictionaryable, JsonSerializable, JsonDeserializable):
         self.request_write_access: bool = request_write_access
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = {"url": self.url}
@@ -1887,7 +1901,7 @@ class ChatPermissions(JsonDeserializable, JsonSerializable, Dictionaryable):
             self.can_send_voice_notes = can_send_media_messages
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = dict()
@@ -1941,7 +1955,7 @@ class BotCommand(JsonSerializable, JsonDeserializable, Dictionaryable):
         self.description: str = description
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {"command": self.command, "description": self.description}
@@ -1973,7 +1987,7 @@ class BotCommandScope(ABC, JsonSerializable):
             json_dict["chat_id"] = self.chat_id
         if self.user_id:
             json_dict["user_id"] = self.user_id
-        return json.dumps(json_dict)
+        return _dumps(json_dict)
 
 
 class BotCommandScopeDefault(BotCommandScope):
@@ -2314,7 +2328,7 @@ class InlineQueryResultBase(ABC, Dictionaryable, JsonSerializable):
         self.parse_mode = parse_mode
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = {"type": self.type, "id": self.id}
@@ -2965,7 +2979,7 @@ class InlineQueryResultCachedBase(ABC, JsonSerializable):
             json_dict["parse_mode"] = self.parse_mode
         if self.caption_entities:
             json_dict["caption_entities"] = MessageEntity.to_list_of_dicts(self.caption_entities)
-        return json.dumps(json_dict)
+        return _dumps(json_dict)
 
 
 class InlineQueryResultCachedPhoto(InlineQueryResultCachedBase):
@@ -3264,7 +3278,7 @@ class LabeledPrice(JsonSerializable, Dictionaryable):
         return {"label": self.label, "amount": self.amount}
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class Invoice(JsonDeserializable):
@@ -3336,7 +3350,7 @@ class ShippingOption(JsonSerializable):
         price_list = []
         for p in self.prices:
             price_list.append(p.to_dict())
-        json_dict = json.dumps({"id": self.id, "title": self.title, "prices": price_list})
+        json_dict = _dumps({"id": self.id, "title": self.title, "prices": price_list})
         return json_dict
 
 
@@ -3510,7 +3524,7 @@ class MaskPosition(Dictionaryable, JsonDeserializable, JsonSerializable):
         self.scale: float = scale
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {
@@ -3540,7 +3554,7 @@ class InputMedia(Dictionaryable, JsonSerializable):
             self._media_dic = "attach://{0}".format(self._media_name)
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = {"type": self.type, "media": self._media_dic}
@@ -3722,7 +3736,7 @@ class PollOption(JsonDeserializable):
     # Converted in _convert_poll_options
     # def to_json(self):
     #     # send_poll Option is a simple string: https://core.telegram.org/bots/api#sendpoll
-    #     return json.dumps(self.text)
+    #     return _dumps(self.text)
 
 
 class Poll(JsonDeserializable):
@@ -3800,7 +3814,7 @@ class PollAnswer(JsonSerializable, JsonDeserializable, Dictionaryable):
         self.option_ids: List[int] = option_ids
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {
@@ -3824,7 +3838,7 @@ class ChatLocation(JsonSerializable, JsonDeserializable, Dictionaryable):
         self.address: str = address
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         return {"location": self.location.to_dict(), "address": self.address}
@@ -3863,7 +3877,7 @@ class ChatInviteLink(JsonSerializable, JsonDeserializable, Dictionaryable):
         self.pending_join_request_count = pending_join_request_count
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def to_dict(self):
         json_dict = {
@@ -4014,7 +4028,7 @@ class MenuButtonCommands(MenuButton):
         return {"type": self.type}
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class MenuButtonWebApp(MenuButton):
@@ -4027,7 +4041,7 @@ class MenuButtonWebApp(MenuButton):
         return {"type": self.type, "text": self.text, "web_app": self.web_app.to_dict()}
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class MenuButtonDefault(MenuButton):
@@ -4038,7 +4052,7 @@ class MenuButtonDefault(MenuButton):
         return {"type": self.type}
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class ChatAdministratorRights(JsonDeserializable, JsonSerializable, Dictionaryable):
@@ -4104,7 +4118,7 @@ class ChatAdministratorRights(JsonDeserializable, JsonSerializable, Dictionaryab
         return json_dict
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class InputFile:
@@ -4487,7 +4501,7 @@ class InputSticker(Dictionaryable, JsonSerializable):
         return json_dict
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def convert_input_sticker(self):
         if util.is_string(self.sticker):
@@ -4549,7 +4563,7 @@ class SwitchInlineQueryChosenChat(JsonDeserializable, Dictionaryable, JsonSerial
         return json_dict
 
     def to_json(self):
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class BotName(JsonDeserializable):
@@ -4612,7 +4626,7 @@ class InlineQueryResultsButton(JsonSerializable, Dictionaryable):
         return json_dict
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
 
 class Story(JsonDeserializable):
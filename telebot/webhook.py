@@ -10,7 +10,7 @@ from aiohttp import web
 from aiohttp.typedefs import Handler as AiohttpHandler
 
 from telebot import api, types
-from telebot.graceful_shutdown import GracefulShutdownCondition
+from telebot.graceful_shutdown import GracefulShutdownCondition, PreventShutdown
 from telebot.metrics import TelegramUpdateMetrics
 from telebot.runner import BotRunner
 from telebot.util import create_error_logging_task, log_error
@@ -20,6 +20,16 @@ logger = logging.getLogger(__name__)
 
 WEBHOOK_ROUTE = "/webhook/{subroute}/"
 
+# Telegram delivers updates over a small pool of long-lived connections; keep them open
+# well beyond aiohttp's 15s default to avoid TLS re-handshakes between updates
+KEEPALIVE_TIMEOUT = 75
+
+# resolved once at import time; signal handlers should do as little work as possible
+_SIGNAL_NAMES = {int(sig): sig.name for sig in (signal.SIGINT, signal.SIGTERM)}
+
+# how often shutdown conditions are re-checked while draining; only used after a shutdown signal
+SHUTDOWN_POLLING_INTERVAL = 0.25
+
 
 async def noop_metrics_handler(m: TelegramUpdateMetrics) -> None:
     logger.debug(f"Metrics: {m}")
@@ -39,6 +49,7 @@ class WebhookApp:
         self.aiohttp_app.middlewares.append(self._graceful_shutdown_middleware)
         self._current_request_count = 0
         self._is_shutting_down = False
+        self._shutdown_event = asyncio.Event()
         self._metrics_handler = metrics_handler
 
     async def _bot_webhook_handler(self, request: web.Request):
@@ -51,7 +62,7 @@ class WebhookApp:
         update = None
         try:
             update = types.Update.de_json(
-                await request.json(),
+                api._loads(await request.read()),
                 metrics=TelegramUpdateMetrics(
                     bot_prefix=bot_runner.bot_prefix,
                     received_at=time.time(),
@@ -62,43 +73,59 @@ class WebhookApp:
         except Exception:
             update_id = update.update_id if update is not None else "<not defined>"
             logger.exception(f"Unexpected error processing update #{update_id}:\n{update}")
-        finally:
-            if update is not None and update.metrics is not None:
-                with log_error("Handling metrics with app-wide handler", logger):
-                    await self._metrics_handler(update.metrics)
-                if bot_runner.metrics_handler is not None:
-                    with log_error("Handling metrics with runner-specific handler", bot_runner.bot.logger):
-                        await bot_runner.metrics_handler(update.metrics)
-            return web.Response()
+        if update is not None and update.metrics is not None:
+            with log_error("Handling metrics with app-wide handler", logger):
+                await self._metrics_handler(update.metrics)
+            if bot_runner.metrics_handler is not None:
+                with log_error("Handling metrics with runner-specific handler", bot_runner.bot.logger):
+                    await bot_runner.metrics_handler(update.metrics)
+        return web.Response()
 
     @web.middleware
     async def _graceful_shutdown_middleware(self, request: web.Request, handler: AiohttpHandler) -> web.StreamResponse:
         if self._is_shutting_down:
-            raise web.HTTPInternalServerError(reason="Server is going offline, try again later")
+            raise web.HTTPServiceUnavailable(reason="Server is going offline, try again later")
         self._current_request_count += 1
         try:
             return await handler(request)
         finally:
             self._current_request_count -= 1
 
+    def _install_graceful_shutdown_signal_handlers(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                # preferred: the handler runs as a regular loop callback, not in signal context
+                loop.add_signal_handler(sig, self._graceful_shutdown_signal_handler, sig, None)
+            except NotImplementedError:  # e.g. Windows event loops
+                signal.signal(sig, self._graceful_shutdown_signal_handler)
+
     def _graceful_shutdown_signal_handler(self, sig: int, frame: Optional[FrameType]):
         if not self._is_shutting_down:
-            logger.info(f"Shutdown signal received: {signal.Signals(sig).name}, entering shutdown state")
+            logger.info(f"Shutdown signal received: {_SIGNAL_NAMES.get(sig, sig)}, entering shutdown state")
             self._is_shutting_down = True
+            self._shutdown_event.set()
         else:
-            logger.info(f"Repeated shutdown signal received: {signal.Signals(sig).name}, ignoring")
+            logger.info(f"Repeated shutdown signal received: {_SIGNAL_NAMES.get(sig, sig)}, ignoring")
 
     async def _graceful_shutdown_monitor(self):
+        # no periodic wakeups while the app is healthy — the signal handler sets the event
+        await self._shutdown_event.wait()
         while True:
-            await asyncio.sleep(1)
-            if not self._is_shutting_down:
-                continue
+            await asyncio.sleep(SHUTDOWN_POLLING_INTERVAL)
             if self._current_request_count > 0:
                 logger.info(
                     f"Not ready to shutdown, still processing {self._current_request_count} request(s), waiting"
                 )
                 continue
+            if PreventShutdown.active_count() > 0:
+                logger.info(
+                    f"Not ready to shutdown, {PreventShutdown.active_count()} active shutdown prevention context(s)"
+                )
+                continue
             for condition in GracefulShutdownCondition.instances:
+                if isinstance(condition, PreventShutdown):
+                    continue  # covered by the counter check above
                 if not await condition.is_ready():
                     logger.info(f"Custom shutdown condition is not yet satisfied, waiting: {condition.description!r}")
                     break
@@ -165,15 +192,13 @@ class WebhookApp:
 
     async def _cancel_background_tasks(self, subroute: str) -> None:
         tasks = self.background_task_by_bot_subroute.get(subroute)
-        if tasks is None:
+        if not tasks:
             return
         for task in tasks:
             logger.debug(f"Cancelling background task {task} for {subroute}")
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        # cancel first, then wait for all at once, so tasks wind down in parallel
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def run(
         self,
@@ -181,7 +206,7 @@ class WebhookApp:
         graceful_shutdown: bool = True,
         on_server_listening: Optional[Callable[[], Coroutine[None, None, Any]]] = None,
     ):
-        aiohttp_runner = web.AppRunner(self.aiohttp_app, access_log=None)
+        aiohttp_runner = web.AppRunner(self.aiohttp_app, access_log=None, keepalive_timeout=KEEPALIVE_TIMEOUT)
         await aiohttp_runner.setup()
         site = web.TCPSite(aiohttp_runner, "0.0.0.0", port)
         try:
@@ -189,8 +214,7 @@ class WebhookApp:
             if on_server_listening is not None:
                 await on_server_listening()
             if graceful_shutdown:
-                signal.signal(signal.SIGINT, self._graceful_shutdown_signal_handler)
-                signal.signal(signal.SIGTERM, self._graceful_shutdown_signal_handler)
+                self._install_graceful_shutdown_signal_handlers()
                 await self._graceful_shutdown_monitor()
             else:
                 while True:
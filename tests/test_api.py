@@ -0,0 +1,146 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Optional, cast
+
+import aiohttp
+import pytest
+
+from telebot import api
+
+
+def http_exception(status: int, retry_after: Optional[int] = None) -> api.ApiHTTPException:
+    response_json = {"ok": False, "description": "test error"}
+    if retry_after is not None:
+        response_json["parameters"] = {"retry_after": retry_after}
+    response = cast(
+        aiohttp.ClientResponse,
+        SimpleNamespace(status=status, url="https://api.telegram.org/bot123/method", reason="Test"),
+    )
+    return api.ApiHTTPException(response_json, response)
+
+
+class FakeSession:
+    """Plays back a scripted sequence of outcomes: exceptions are raised on request,
+    anything else is treated as an already-parsed response body."""
+
+    def __init__(self, outcomes: list):
+        self.outcomes = outcomes
+        self.request_count = 0
+
+    def request(self, **kwargs):
+        self.request_count += 1
+        outcome = self.outcomes.pop(0)
+
+        class RequestContext:
+            async def __aenter__(self):
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+            async def __aexit__(self, *args):
+                return None
+
+        return RequestContext()
+
+
+@pytest.fixture
+def sleep_delays(monkeypatch) -> list:
+    """Replaces asyncio.sleep with an instant version, recording requested delays."""
+    delays: list = []
+    real_sleep = asyncio.sleep
+
+    async def instant_sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", instant_sleep)
+    return delays
+
+
+def install_fake_session(monkeypatch, outcomes: list) -> FakeSession:
+    session = FakeSession(outcomes)
+
+    async def get_session():
+        return session
+
+    async def passthrough_check_response(resp):
+        return resp
+
+    monkeypatch.setattr(api.session_manager, "get_session", get_session)
+    monkeypatch.setattr(api, "_check_response", passthrough_check_response)
+    return session
+
+
+async def test_request_does_not_retry_client_errors(monkeypatch, sleep_delays):
+    session = install_fake_session(monkeypatch, [http_exception(400)])
+    with pytest.raises(api.ApiHTTPException):
+        await api._request("token", "sendMessage")
+    assert session.request_count == 1
+    assert sleep_delays == []
+
+
+async def test_request_retries_flood_wait_using_retry_after(monkeypatch, sleep_delays):
+    session = install_fake_session(
+        monkeypatch,
+        [http_exception(429, retry_after=3), {"ok": True, "result": "done"}],
+    )
+    assert await api._request("token", "sendMessage") == "done"
+    assert session.request_count == 2
+    assert sleep_delays == [3]
+
+
+async def test_request_caps_huge_retry_after(monkeypatch, sleep_delays):
+    install_fake_session(
+        monkeypatch,
+        [http_exception(429, retry_after=10_000), {"ok": True, "result": "done"}],
+    )
+    assert await api._request("token", "sendMessage") == "done"
+    assert sleep_delays == [api.RETRY_AFTER_MAX_DELAY]
+
+
+async def test_request_transient_error_retry_exhaustion(monkeypatch, sleep_delays):
+    session = install_fake_session(monkeypatch, [aiohttp.ServerDisconnectedError() for _ in range(api.MAX_RETRIES)])
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        await api._request("token", "sendMessage")
+    assert session.request_count == api.MAX_RETRIES
+    # no sleep after the final attempt, only between attempts
+    assert len(sleep_delays) == api.MAX_RETRIES - 1
+
+
+async def test_send_many_ordering_and_concurrency(monkeypatch):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_request(token, route, method="get", params=None, files=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return params["idx"]
+
+    monkeypatch.setattr(api, "_request", fake_request)
+
+    calls = [("sendMessage", {"idx": idx}, None) for idx in range(10)]
+    results = await api.send_many("token", calls, concurrency=3)
+    assert results == list(range(10))
+    assert max_in_flight == 3
+
+
+async def test_send_many_return_exceptions(monkeypatch):
+    async def fake_request(token, route, method="get", params=None, files=None):
+        if params["idx"] == 1:
+            raise RuntimeError("boom")
+        return params["idx"]
+
+    monkeypatch.setattr(api, "_request", fake_request)
+
+    calls = [("sendMessage", {"idx": idx}, None) for idx in range(3)]
+
+    with pytest.raises(RuntimeError):
+        await api.send_many("token", calls)
+
+    results = await api.send_many("token", calls, return_exceptions=True)
+    assert results[0] == 0
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == 2
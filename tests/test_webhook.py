@@ -300,7 +300,7 @@ async def test_webhook_app_graceful_shutdown():
     await asyncio.wait_for(server_exited_with_sys_exit, timeout=30)
 
     assert resp_completed.status == 200
-    assert resp_rejected.status == 500
+    assert resp_rejected.status == 503
     assert message_processing_started
     assert message_processing_ended
     assert background_job_1_completed
@@ -319,6 +319,38 @@ async def test_graceful_shutdown_conditions():
     assert len(actual_conditions) == 0
 
 
+async def test_prevent_shutdown_is_reentrant():
+    prevent_shutdown = PreventShutdown("nested work")
+    assert prevent_shutdown.is_ready_to_shutdown()
+    assert PreventShutdown.active_count() == 0
+    async with prevent_shutdown:
+        assert not prevent_shutdown.is_ready_to_shutdown()
+        assert PreventShutdown.active_count() == 1
+        async with prevent_shutdown:
+            assert not prevent_shutdown.is_ready_to_shutdown()
+            assert PreventShutdown.active_count() == 1  # same instance, still one active context
+        # inner exit must not drop prevention held by the outer context
+        assert not prevent_shutdown.is_ready_to_shutdown()
+        assert PreventShutdown.active_count() == 1
+    assert prevent_shutdown.is_ready_to_shutdown()
+    assert PreventShutdown.active_count() == 0
+
+
+async def test_allow_shutdown_inside_nested_prevention():
+    prevent_shutdown = PreventShutdown("nested work")
+    async with prevent_shutdown:
+        async with prevent_shutdown:
+            async with prevent_shutdown.allow_shutdown():
+                assert prevent_shutdown.is_ready_to_shutdown()
+                assert PreventShutdown.active_count() == 0
+            # full nesting depth is restored after the negated context
+            assert not prevent_shutdown.is_ready_to_shutdown()
+            assert PreventShutdown.active_count() == 1
+        assert not prevent_shutdown.is_ready_to_shutdown()
+    assert prevent_shutdown.is_ready_to_shutdown()
+    assert PreventShutdown.active_count() == 0
+
+
 async def test_webhook_app_background_tasks(bot_runner: BotRunner):
     reset_global_test_state()
     webhook_app = WebhookApp(base_url="localhost")